@@ -1,16 +1,23 @@
+import os
 import asyncio
 from asyncio import Event
 from typing import List, Dict
 from PySide6.QtCore import QThread, Signal
 
-from lib.daq import DAQ
+from lib.daq import DAQ, Device, DeviceStats
 from lib.daq.ni_device import NIDevice
 from lib.daq.ni_device.channel_initializers import VibChannelInitializer, TempChannelInitializer
+from lib.daq.sim_device import SimDevice, ReplayDevice
 
-from config import NIDeviceConfig, NIDeviceType, DAQSystemConfig, MachineConfig
+from lib.dispatcher import OverflowPolicy
+from lib.metrics import Stage, HistogramSnapshot, get_registry
+
+from config import NIDeviceConfig, NIDeviceType, DeviceBackend, DAQSystemConfig, MachineConfig
+from config.paths import LOG_DIR, METRICS_LOG, MODEL_DIR
 from .data_saver import DataSaver
 from .data_sender import DataSender
-from .machine import Machine, EventHandler, MachineEvent
+from .machine import Machine, EventHandler, MachineEvent, FaultDetectStats
+from .inference import InferenceWorker, InferenceScheduler
 
 
 class DAQSystem(QThread):
@@ -22,27 +29,50 @@ class DAQSystem(QThread):
         self._event = Event()
 
         self.sensor_types: Dict[str, NIDeviceType] = {}
-        self._ni_devices: List[NIDevice] = [self.create_ni_device(ni_conf) for ni_conf in self._conf.NI_DEVICES]
+        self._inference_scheduler: InferenceScheduler = None
+        if any(m_conf.FAULT_DETECTABLE for m_conf in self._conf.MACHINES):
+            # 모든 Machine 의 추론 요청을 모아 같은 모델끼리 한 번에 처리함
+            model_dirs = [os.path.join(MODEL_DIR, m_conf.NAME) for m_conf in self._conf.MACHINES if m_conf.FAULT_DETECTABLE]
+            worker = InferenceWorker(max_workers=self._conf.INFERENCE_WORKERS,
+                                     engine=self._conf.INFERENCE_ENGINE,
+                                     model_dirs=model_dirs)
+            self._inference_scheduler = InferenceScheduler(worker=worker,
+                                                           window=self._conf.INFERENCE_BATCH_WINDOW)
+        self._ni_devices: List[Device] = [self.create_ni_device(ni_conf) for ni_conf in self._conf.NI_DEVICES]
+        self._data_savers: List[DataSaver] = []
         self._machines: List[Machine] = [self.create_machine(m_conf) for m_conf in self._conf.MACHINES]
 
-        self._daq: DAQ = DAQ(ni_devices=self._ni_devices)
+        self._daq: DAQ = DAQ(ni_devices=self._ni_devices,
+                             shared_buffer_seconds=self._conf.SHARED_BUFFER_SECONDS)
         for machine in self._machines:
             self._daq.register_data_handler(machine)
 
         self._loop = asyncio.get_event_loop()
         self._event_sender: EventSender = EventSender(self.event_signal)
 
-    def create_ni_device(self, d_conf: NIDeviceConfig) -> NIDevice:
-        if d_conf.TYPE == NIDeviceType.VIB:
-            channel_initializer = VibChannelInitializer()
-        elif d_conf.TYPE == NIDeviceType.TEMP:
-            channel_initializer = TempChannelInitializer()
+    def create_ni_device(self, d_conf: NIDeviceConfig) -> Device:
+        backend_options = d_conf.BACKEND_OPTIONS or {}
+        if d_conf.BACKEND == DeviceBackend.SIM:
+            ni_device = SimDevice(name=d_conf.NAME,
+                                  rate=d_conf.RATE,
+                                  seed=backend_options.get('SEED'))
+        elif d_conf.BACKEND == DeviceBackend.REPLAY:
+            ni_device = ReplayDevice(name=d_conf.NAME,
+                                     rate=d_conf.RATE,
+                                     path=backend_options['PATH'],
+                                     date=backend_options['DATE'],
+                                     speed=backend_options.get('SPEED', 1.0))
         else:
-            raise RuntimeError('invalid device type')
+            if d_conf.TYPE == NIDeviceType.VIB:
+                channel_initializer = VibChannelInitializer()
+            elif d_conf.TYPE == NIDeviceType.TEMP:
+                channel_initializer = TempChannelInitializer()
+            else:
+                raise RuntimeError('invalid device type')
 
-        ni_device = NIDevice(name=d_conf.NAME,
-                             rate=d_conf.RATE,
-                             channel_initializer=channel_initializer)
+            ni_device = NIDevice(name=d_conf.NAME,
+                                 rate=d_conf.RATE,
+                                 channel_initializer=channel_initializer)
 
         for s_conf in d_conf.SENSORS:
             self.sensor_types[s_conf.NAME] = d_conf.TYPE
@@ -56,7 +86,9 @@ class DAQSystem(QThread):
         machine = Machine(name=m_conf.NAME,
                           sensors=m_conf.SENSORS,
                           fault_detectable=m_conf.FAULT_DETECTABLE,
-                          fault_threshold=m_conf.FAULT_THRESHOLD)
+                          fault_threshold=m_conf.FAULT_THRESHOLD,
+                          inference_scheduler=self._inference_scheduler,
+                          fault_detect_policy=self._conf.FAULT_DETECT_POLICY)
 
         send_conf = m_conf.DATA_SEND_MODE
         if send_conf.ACTIVATION:
@@ -66,14 +98,18 @@ class DAQSystem(QThread):
                                      port=send_conf.PORT,
                                      timeout=send_conf.TIMEOUT,
                                      sensor_types=cur_sensor_types)
-            machine.register_handler(data_sender)
+            # 전송이 밀리면 대기 중인 블록을 합쳐서 보냄
+            machine.register_handler(data_sender, policy=OverflowPolicy.COALESCE)
 
         save_conf = m_conf.DATA_SAVE_MODE
         if save_conf.ACTIVATION:
             data_saver = DataSaver(name=m_conf.NAME,
                                    sensors=m_conf.SENSORS,
-                                   external_path=save_conf.PATH)
-            machine.register_handler(data_saver)
+                                   external_path=save_conf.PATH,
+                                   save_format=save_conf.FORMAT)
+            # 저장 데이터는 유실되지 않도록 대기함
+            machine.register_handler(data_saver, policy=OverflowPolicy.BLOCK)
+            self._data_savers.append(data_saver)
 
         return machine
 
@@ -83,12 +119,56 @@ class DAQSystem(QThread):
     def get_conf(self):
         return self._conf
 
+    def get_device_stats(self) -> Dict[str, DeviceStats]:
+        return self._daq.get_device_stats()
+
+    def get_shared_buffer_names(self) -> Dict[str, str]:
+        return self._daq.get_shared_buffer_names()
+
+    def get_metrics(self) -> Dict[Stage, HistogramSnapshot]:
+        return get_registry().snapshot()
+
+    def get_fault_detect_stats(self) -> Dict[str, FaultDetectStats]:
+        return {machine.get_name(): machine.get_fault_detect_stats()
+                for machine in self._machines if machine.is_fault_detectable()}
+
+    def dump_metrics(self, path: str = METRICS_LOG) -> None:
+        os.makedirs(os.path.dirname(path) or LOG_DIR, exist_ok=True)
+        get_registry().dump(path)
+        with open(path, 'a', encoding='utf-8') as f:
+            for name, stats in self.get_fault_detect_stats().items():
+                f.write(f'{name} : scored={stats.SCORED} gated={stats.GATED} skip_rate={stats.skip_rate():.3f} '
+                        f'audited={stats.AUDITED} disagreed={stats.DISAGREED} dropped={stats.DROPPED} '
+                        f'ring_lost={stats.RING_LOST}\n')
+
+    async def _dump_metrics_periodically(self, interval: int) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.dump_metrics()
+            except Exception as err:
+                print(f'Metrics Dump Error : \n{str(err)}')
+
     def run(self) -> None:
         self._daq.read_start()
+        shared_buffer_names = self._daq.get_shared_buffer_names()
+        if shared_buffer_names:
+            for machine in self._machines:
+                machine.attach_shared_buffers(shared_buffer_names)
+        if self._conf.METRICS_DUMP_INTERVAL > 0:
+            self._loop.create_task(self._dump_metrics_periodically(self._conf.METRICS_DUMP_INTERVAL))
         self._loop.run_until_complete(self._event.wait())
+        for machine in self._machines:
+            machine.detach_shared_buffers()
+        self._daq.read_stop()
+        for data_saver in self._data_savers:
+            data_saver.close()
+        if self._inference_scheduler is not None:
+            self._inference_scheduler.close()
 
     def set_monitoring_target(self, machine: Machine):
-        self._event_sender.set_machine(machine)
+        # GUI 스레드에서 호출되므로 handler 등록, 해제는 DAQ 이벤트 루프에서 실행함
+        self._loop.call_soon_threadsafe(self._event_sender.set_machine, machine)
 
     def stop(self):
         self._event.set()
@@ -105,7 +185,8 @@ class EventSender(EventHandler):
         if self._machine is not None:
             self._machine.remove_handler(self)
         self._machine = machine
-        self._machine.register_handler(self)
+        # 화면 갱신이 밀리면 오래된 이벤트를 버림
+        self._machine.register_handler(self, policy=OverflowPolicy.DROP_OLDEST)
 
     async def event_handle(self, event: MachineEvent, data: Dict) -> None:
         zipped_data = (event, data)
@@ -1,10 +1,14 @@
 import os
 import shutil
-from typing import List, Dict
+import threading
+from typing import List, Dict, Union
 
-from util.clock import get_date, get_time, TimeEvent
+from util.clock import get_date, get_times, TimeEvent
+from config import SaveFormat
 from config.paths import DATA_DIR
+from lib.archive import ArchiveWriter
 from lib.csv_writer import CsvWriter
+from lib.metrics import Stage, get_registry
 from .machine import EventHandler
 from .machine.machine_event import MachineEvent
 
@@ -13,27 +17,63 @@ class DataSaver(EventHandler):
     def __init__(self,
                  name: str,
                  sensors: List[str],
-                 external_path: str):
+                 external_path: str,
+                 save_format: SaveFormat = SaveFormat.CSV):
         self._save_path = os.path.join(DATA_DIR, name)
         self._sensors = sensors
         self._external_path = os.path.join(external_path, name)
+        self._save_format = save_format
 
-        self._writers: Dict[str, CsvWriter] = {}
+        self._writers: Dict[str, Union[CsvWriter, ArchiveWriter]] = {}
+        self._date: str = None
+        self._retiring: List[threading.Thread] = []
         self._time_event = TimeEvent()
         self._init_writers()
 
-    def _init_writers(self):
-        self._writers = {}
-
+    def _init_writers(self) -> Dict[str, Union[CsvWriter, ArchiveWriter]]:
+        # 현재 날짜의 파일을 열어 writer 묶음을 바꾸고 이전 묶음을 반환함
+        self._date = get_date()
         os.makedirs(self._save_path, exist_ok=True)
         os.makedirs(self._external_path, exist_ok=True)
+        writers = {}
         for sensor in self._sensors:
+            if self._save_format is SaveFormat.BINARY:
+                writers[sensor] = ArchiveWriter(self._save_path, self._date, sensor)
+                continue
             header: List[str] = ['time', 'data']
-            path = os.path.join(self._save_path, f'{get_date()}_{sensor}.csv')
-            self._writers[sensor] = CsvWriter(path, header)
+            path = os.path.join(self._save_path, f'{self._date}_{sensor}.csv')
+            writers[sensor] = CsvWriter(path, header)
+
+        prev_writers, self._writers = self._writers, writers
+        return prev_writers
+
+    def close(self):
+        # 쓰기 스레드에 남은 행을 모두 쓰고 파일을 닫음, 날짜가 바뀌어 정리 중인 이전 파일도 끝날 때까지 기다림
+        _close_writers(self._writers)
+        self._writers = {}
+        for thread in self._retiring:
+            thread.join()
+        self._retiring = []
 
-    def _move_files(self):
-        files = os.listdir(self._save_path)
+    def _retire_writers(self, writers: Dict[str, Union[CsvWriter, ArchiveWriter]]) -> None:
+        # 이전 날짜 파일의 남은 행 쓰기, 닫기, 이동은 오래 걸리므로 이벤트 루프가 아닌 별도 스레드에서 처리함
+        self._retiring = [thread for thread in self._retiring if thread.is_alive()]
+        thread = threading.Thread(target=self._retire, args=(writers, self._date),
+                                  name=f'DataSaver.retire({os.path.basename(self._save_path)})')
+        self._retiring.append(thread)
+        thread.start()
+
+    def _retire(self, writers: Dict[str, Union[CsvWriter, ArchiveWriter]], keep_date: str) -> None:
+        try:
+            # 열려 있는 파일을 먼저 닫아야 옮길 수 있음
+            _close_writers(writers)
+            self._move_files(keep_date)
+        except Exception as err:
+            print(f'Data Save Error : \n{str(err)}')
+
+    def _move_files(self, keep_date: str):
+        # 현재 writer 가 쓰고 있는 keep_date 의 파일을 제외하고 옮김
+        files = [file_name for file_name in os.listdir(self._save_path) if not file_name.startswith(keep_date)]
 
         os.makedirs(self._external_path, exist_ok=True)
         for file_name in files:
@@ -44,10 +84,23 @@ class DataSaver(EventHandler):
     async def event_handle(self, event: MachineEvent, data: Dict) -> None:
         if event is MachineEvent.DataUpdate:
             if self._time_event.is_day_change():
-                self._move_files()
-                self._init_writers()
+                # 새 날짜의 파일로 먼저 바꿔 저장을 이어가고, 이전 파일은 별도 스레드에서 정리함
+                self._retire_writers(self._init_writers())
+
+            metrics = get_registry()
+            for sensor, block in data.items():
+                if self._save_format is SaveFormat.BINARY:
+                    # 샘플별 시각 없이 블록 시작 시각과 rate 만 chunk 에 기록함
+                    self._writers[sensor].add_data(block.start, block.rate, block.data)
+                else:
+                    # 블록의 수집 시각과 rate 로 샘플별 시각을 계산함 (ms 단위)
+                    times = get_times(block.start, block.rate, len(block))
+                    datas = list(zip(times.tolist(), block.data.tolist()))
+                    self._writers[sensor].add_datas(datas)
+                    await self._writers[sensor].drain()
+                metrics.record_since(Stage.SAVE, block.acquired, len(block))
+
 
-            cur_time = get_time()
-            for sensor, datas in data.items():
-                datas = [[cur_time, data] for data in datas]
-                self._writers[sensor].add_datas(datas)
+def _close_writers(writers: Dict[str, Union[CsvWriter, ArchiveWriter]]) -> None:
+    for writer in writers.values():
+        writer.close()
@@ -3,6 +3,8 @@ from typing import Dict
 from scipy import signal
 
 from config import NIDeviceType
+from lib.daq import SampleBlock
+from lib.metrics import Stage, get_registry
 from .machine_client import MachineClient
 from .machine import EventHandler
 from .machine.machine_event import MachineEvent
@@ -43,20 +45,20 @@ class DataSender(EventHandler):
 
     async def event_handle(self, event: MachineEvent, data: Dict) -> None:
         if not self.is_closing():
+            blocks = data.values() if event is MachineEvent.DataUpdate else []
             event, data = self.convert(event, data)
             self.protocol.send_data(event=event, data=data)
 
+            metrics = get_registry()
+            for block in blocks:
+                metrics.record_since(Stage.SEND, block.acquired, len(block))
+
     def is_closing(self) -> bool:
         return self.protocol is None or self.protocol.is_closing()
 
     def convert(self, event: MachineEvent, data: Dict):
         if event is MachineEvent.DataUpdate:
-            data = {
-                sensor: {
-                    'type': self.sensor_types[sensor].name,
-                    'data': signal.resample(s_data, MAXIMUM_RATE).tolist() if MAXIMUM_RATE < len(s_data) else s_data
-                } for sensor, s_data in data.items()
-            }
+            data = {sensor: self._convert_block(sensor, block) for sensor, block in data.items()}
         elif event is MachineEvent.FaultDetect:
             """
             data = {
@@ -69,3 +71,16 @@ class DataSender(EventHandler):
             raise RuntimeError('Undefined Event')
 
         return event.name, data
+
+    def _convert_block(self, sensor: str, block: SampleBlock) -> Dict:
+        # start, rate 로 수신 측에서 샘플별 시각을 계산할 수 있음, 리샘플 시 rate 도 함께 바꿈
+        datas, rate = block.data, block.rate
+        if MAXIMUM_RATE < len(block):
+            datas = signal.resample(datas, MAXIMUM_RATE)
+            rate = block.rate * MAXIMUM_RATE / len(block)
+        return {
+            'type': self.sensor_types[sensor].name,
+            'data': datas.tolist(),
+            'start': block.start,
+            'rate': rate
+        }
@@ -0,0 +1,2 @@
+from .inference_worker import InferenceWorker
+from .inference_scheduler import InferenceScheduler
@@ -0,0 +1,88 @@
+import asyncio
+import numpy as np
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from .inference_worker import InferenceWorker
+
+BATCH_WINDOW: float = 0.05      # sec
+MAX_REQUESTS: int = 64
+
+ModelKey = Tuple[str, str, bool]    # (model_dir, 모델 이름, 정규화 여부)
+
+
+class InferenceScheduler:
+    """
+        여러 Machine 의 추론 요청을 짧은 시간 동안 모아 작업 프로세스에 한 번에 넘기는 scheduler
+        같은 모델 파일에 대한 배치는 이어붙여 한 번의 forward pass 로 처리하고, 결과는 요청별로 돌려줌
+        Machine 은 InferenceWorker 대신 이 scheduler 의 preload / detect 를 사용함
+    """
+    def __init__(self,
+                 worker: InferenceWorker,
+                 window: float = BATCH_WINDOW,
+                 max_requests: int = MAX_REQUESTS):
+        self._worker = worker
+        self._window = window
+        self._max_requests = max_requests
+
+        self._loop = asyncio.get_event_loop()
+        self._pending: List[Tuple[ModelKey, np.ndarray, asyncio.Future]] = []
+        self._flush_handle: asyncio.TimerHandle = None
+
+    def preload(self, model_dir: str) -> None:
+        self._worker.preload(model_dir)
+
+    async def detect(self, model_dir: str, model_name: str, batch: np.ndarray, normalized: bool = False) -> int:
+        future = self._loop.create_future()
+        self._pending.append(((model_dir, model_name, normalized), batch, future))
+
+        if len(self._pending) >= self._max_requests:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(self._window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        groups: Dict[ModelKey, List[Tuple[np.ndarray, asyncio.Future]]] = defaultdict(list)
+        for key, batch, future in pending:
+            groups[key].append((batch, future))
+
+        # 작업 프로세스 수만큼 나누어 병렬로 넘김
+        keys = list(groups.keys())
+        workers = max(min(self._worker.max_workers(), len(keys)), 1)
+        for i in range(workers):
+            chunk = {key: groups[key] for key in keys[i::workers]}
+            self._loop.create_task(self._run(chunk))
+
+    async def _run(self, groups: Dict[ModelKey, List[Tuple[np.ndarray, asyncio.Future]]]) -> None:
+        requests = [(model_dir, model_name, [batch for batch, _ in items], normalized)
+                    for (model_dir, model_name, normalized), items in groups.items()]
+        try:
+            results = await self._worker.detect_many(requests)
+        except Exception as err:
+            for items in groups.values():
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(err)
+            return
+
+        for items, scores in zip(groups.values(), results):
+            for (_, future), score in zip(items, scores):
+                if not future.done():
+                    future.set_result(score)
+
+    def close(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for _, _, future in self._pending:
+            future.cancel()
+        self._pending = []
+        self._worker.close()
@@ -0,0 +1,72 @@
+import asyncio
+import numpy as np
+from multiprocessing import get_context
+from concurrent.futures import ProcessPoolExecutor, Future
+from typing import Dict, List, Tuple
+
+from lib.lstm_ae import InferenceEngine, ModelRegistry
+
+# 작업 프로세스 안에서만 사용되는 모델 저장소, 프로세스 시작 시 만들어짐
+_registry = None
+
+
+def _init_worker(engine: InferenceEngine, model_dirs: List[str]) -> None:
+    # 작업 프로세스마다 시작 시 모델을 미리 로드하고 warm-up 함
+    global _registry
+    _registry = ModelRegistry(engine)
+    for model_dir in model_dirs:
+        try:
+            _preload(model_dir)
+        except Exception as err:
+            print(f'Model Preload Error ({model_dir}) : \n{str(err)}')
+
+
+def _get_models(model_dir: str) -> Dict:
+    return _registry.load_dir(model_dir)
+
+
+def _preload(model_dir: str) -> None:
+    _get_models(model_dir)
+
+
+def _detect_many(requests: List[Tuple[str, str, List[np.ndarray], bool]]) -> List[List[int]]:
+    # (model_dir, 모델 이름, 배치 목록, 정규화 여부) 마다 같은 모델의 배치를 한 번에 추론함
+    return [_get_models(model_dir)[model_name].detect_batches(batches, normalized)
+            for model_dir, model_name, batches, normalized in requests]
+
+
+def _report_preload(model_dir: str, future: Future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        print(f'Model Preload Error ({model_dir}) : \n{str(future.exception())}')
+
+
+class InferenceWorker:
+    """
+        LstmAE 추론을 별도 프로세스에서 수행하는 작업자
+        모델은 작업 프로세스의 ModelRegistry 에 (파일 경로, 설정) 단위로 한 번 로드되어 유지되며,
+        이벤트 루프는 결과를 await 하는 동안 수집/전송/저장을 계속 처리함
+    """
+    def __init__(self, max_workers: int = 1, engine: InferenceEngine = InferenceEngine.NUMPY, model_dirs: List[str] = None):
+        # PyInstaller 로 빌드된 Windows 환경에서도 동작하도록 spawn 을 사용함 (main 의 freeze_support 필요)
+        # engine : NUMPY 는 TensorFlow 없이 동작함
+        # model_dirs : 각 작업 프로세스가 시작할 때 미리 로드할 모델 디렉토리
+        self._max_workers = max_workers
+        self._pool = ProcessPoolExecutor(max_workers=max_workers,
+                                         mp_context=get_context('spawn'),
+                                         initializer=_init_worker,
+                                         initargs=(engine, list(model_dirs or [])))
+        self._loop = asyncio.get_event_loop()
+
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def preload(self, model_dir: str) -> None:
+        # 결과를 기다리지 않으므로 로드 실패는 완료 callback 에서 출력함
+        future = self._pool.submit(_preload, model_dir)
+        future.add_done_callback(lambda done: _report_preload(model_dir, done))
+
+    async def detect_many(self, requests: List[Tuple[str, str, List[np.ndarray], bool]]) -> List[List[int]]:
+        return await self._loop.run_in_executor(self._pool, _detect_many, requests)
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,55 @@
+import numpy as np
+
+from lib.lstm_ae import Normalizer
+
+CAPACITY_FACTOR: int = 2
+
+
+class BatchBuffer:
+    """
+        고장 감지 배치 하나를 모으는 센서별 고정 크기 float32 버퍼
+        batch_size 를 넘는 샘플은 버리지 않고 다음 배치의 앞부분으로 넘김
+
+        버퍼는 생성 시 한 번만 할당하며, 배치는 복사 없이 연속된 view 로 꺼냄
+        view 는 carry_to() / clear() 전까지만 유효함
+
+        normalizer 가 있으면 블록이 들어올 때 버퍼에 바로 정규화해서 씀
+    """
+    def __init__(self, batch_size: int, capacity: int = None, normalizer: Normalizer = None):
+        self._batch_size = batch_size
+        self._normalizer = normalizer
+        self._buffer = np.empty(capacity or batch_size * CAPACITY_FACTOR, dtype=np.float32)
+        self._fill: int = 0
+
+    def is_normalized(self) -> bool:
+        return self._normalizer is not None
+
+    def __len__(self) -> int:
+        return self._fill
+
+    def is_full(self) -> bool:
+        return self._fill >= self._batch_size
+
+    def append(self, data: np.ndarray) -> int:
+        # 다른 센서를 기다리는 동안 capacity 를 넘어 버린 샘플 수를 반환함
+        count = min(len(data), len(self._buffer) - self._fill)
+        target = self._buffer[self._fill:self._fill + count]
+        if self._normalizer is not None:
+            self._normalizer(data[:count], out=target)
+        else:
+            target[:] = data[:count]
+        self._fill += count
+        return len(data) - count
+
+    def batch(self) -> np.ndarray:
+        return self._buffer[:self._batch_size]
+
+    def carry_to(self, other: 'BatchBuffer') -> None:
+        # 남은 샘플을 다른 버퍼의 앞부분으로 옮김, 이 버퍼의 배치 view 는 그대로 유지됨
+        surplus = max(self._fill - self._batch_size, 0)
+        other._buffer[:surplus] = self._buffer[self._batch_size:self._fill]
+        other._fill = surplus
+        self._fill = min(self._fill, self._batch_size)
+
+    def clear(self) -> None:
+        self._fill = 0
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+# 설정 (DAQSystemConfig.FAULT_DETECT_POLICY) 에 저장되므로 config 에 정의함
+from config import FaultDetectPolicy
+
+
+@dataclass
+class FaultDetectStats:
+    SCORED      : int = 0       # 점수를 계산한 배치 수
+    SKIPPED     : int = 0       # 추론이 밀려 버린 새 배치 수
+    REPLACED    : int = 0       # 최신 배치로 교체되어 버린 대기 배치 수
+    LAG         : float = 0.0   # 마지막 배치가 채워진 뒤 점수가 나오기까지 걸린 시간 (sec)
+    MAX_LAG     : float = 0.0
+    GATED       : int = 0       # 사전 필터가 정상으로 판단해 추론을 생략한 배치 수
+    AUDITED     : int = 0       # 사전 필터가 정상으로 판단했지만 검증을 위해 추론한 배치 수
+    DISAGREED   : int = 0       # 검증 추론 결과가 이상으로 나온 배치 수
+    DROPPED     : int = 0       # 배치 버퍼가 넘쳐 고장 감지에 사용되지 않고 버려진 샘플 수
+    RING_LOST   : int = 0       # 공유 ring buffer 에서 읽기 전에 덮어쓰여 놓친 샘플 수
+
+    def skip_rate(self) -> float:
+        total = self.GATED + self.SCORED
+        return self.GATED / total if total else 0.0
@@ -1,14 +1,23 @@
-import yaml
+import os
+import time
 import asyncio
 
-from typing import Dict, List
-from pandas import DataFrame
+from dataclasses import replace
+from typing import Dict, List, Tuple, Optional
 
-from lib.daq import DataHandler
-from lib.lstm_ae import LstmAE, ModelConfig
+from lib.daq import DataHandler, SampleBlock, merge_named_blocks
+from lib.dispatcher import Dispatcher, OverflowPolicy, DispatchStats
+from lib.lstm_ae import ModelConfig, PreFilter, load_model_configs, load_prefilter
+from lib.metrics import Stage, get_registry
+from lib.shm_ring import SharedRingBuffer, RingReader
 from config.paths import MODEL_DIR
+from ..inference import InferenceScheduler
 from .machine_event import MachineEvent
 from .event_handler import EventHandler
+from .batch_buffer import BatchBuffer
+from .fault_detect_policy import FaultDetectPolicy, FaultDetectStats
+
+HANDLER_QUEUE_SIZE: int = 8
 
 
 class Machine(DataHandler):
@@ -16,18 +25,34 @@ class Machine(DataHandler):
                  name: str,
                  sensors: List[str],
                  fault_detectable: bool = False,
-                 fault_threshold: int = 0):
+                 fault_threshold: int = 0,
+                 inference_scheduler: InferenceScheduler = None,
+                 fault_detect_policy: FaultDetectPolicy = FaultDetectPolicy.NEWEST):
         self._name: str = name
         self._sensors: List[str] = sensors
         self._fault_detectable: bool = fault_detectable
         self._fault_threshold: int = fault_threshold
+        self._inference_scheduler: InferenceScheduler = inference_scheduler
+        self._fault_detect_policy: FaultDetectPolicy = fault_detect_policy
+        self._model_dir: str = os.path.join(MODEL_DIR, self._name)
 
         self._loop = asyncio.get_event_loop()
-        self._event_handlers: List[EventHandler] = []
+        self._dispatchers: Dict[EventHandler, Dispatcher] = {}
 
         if self._fault_detectable:
-            self._models: Dict[str, LstmAE] = {}
-            self._batches: Dict[str, List] = {}
+            self._model_confs: Dict[str, ModelConfig] = {}
+            # 채우는 중인 배치, 추론 중인 배치, 대기 중인 배치를 서로 다른 버퍼 묶음으로 두어
+            # 추론이 진행되는 동안에도 다음 배치를 계속 채움
+            self._batches: Dict[str, BatchBuffer] = {}
+            self._free_batches: List[Dict[str, BatchBuffer]] = []
+            self._pending_batches: Optional[Tuple[Dict[str, BatchBuffer], float, bool]] = None
+            self._scoring: bool = False
+            self._batch_acquired: float = 0.0
+            self._fault_detect_stats = FaultDetectStats()
+            self._prefilter: PreFilter = None
+            # 공유 ring buffer 가 있으면 배치는 블록 복사본 대신 ring 에서 직접 읽어 채움
+            self._rings: Dict[str, SharedRingBuffer] = {}
+            self._ring_readers: Dict[str, RingReader] = {}
             self._init_models()
             self._init_batches()
 
@@ -41,63 +66,199 @@ class Machine(DataHandler):
         return self._fault_detectable
 
     def _init_models(self) -> None:
+        # 모델 자체는 추론 작업 프로세스에서 로드하고, 여기서는 배치 크기 등 설정만 읽음
         try:
-            with open(f'{MODEL_DIR}\\{self._name}\\METADATA.yml', 'r', encoding='UTF-8') as yml:
-                cfg = yaml.safe_load(yml)
-
-            for conf in [ModelConfig(**parm) for parm in cfg['MODELS']]:
-                model = LstmAE(seq_len=conf.SEQ_LEN,
-                               input_dim=1,
-                               latent_dim=conf.LATENT_DIM,
-                               batch_size=conf.BATCH_SIZE,
-                               threshold=conf.THRESHOLD)
-                model.load(f'{MODEL_DIR}\\{self._name}\\{conf.NAME}.h5')
-                self._models[conf.NAME] = model
+            if self._inference_scheduler is None:
+                raise RuntimeError(f'{self._name} : inference scheduler is not set')
+            self._model_confs = {conf.NAME: conf for conf in load_model_configs(self._model_dir)}
+            self._prefilter = load_prefilter(self._model_dir)
+            self._inference_scheduler.preload(self._model_dir)
         except Exception as err:
             self._fault_detectable = False
             print(err)
 
     def _init_batches(self) -> None:
-        self._batches = {name: [] for name in sorted(self._sensors)}
+        self._batches = self._create_batches()
+        self._free_batches = []
+        self._batch_acquired = 0.0
+
+    def _create_batches(self) -> Dict[str, BatchBuffer]:
+        return {name: BatchBuffer(self._model_confs[name].BATCH_SIZE,
+                                  normalizer=self._model_confs[name].normalizer())
+                for name in sorted(self._sensors) if name in self._model_confs}
+
+    def attach_shared_buffers(self, names: Dict[str, str]) -> None:
+        # 센서 이름 -> 공유 메모리 이름, DAQ 가 수집을 시작해 ring 을 만든 뒤 호출해야 함
+        if not self._fault_detectable:
+            return
+        try:
+            for sensor in self._batches:
+                if sensor in names:
+                    self._rings[sensor] = SharedRingBuffer.attach(names[sensor])
+            # 통계는 GUI 스레드에서도 읽으므로 reader 목록은 완성된 뒤 한 번에 바꿈
+            self._ring_readers = {sensor: RingReader(ring) for sensor, ring in self._rings.items()}
+        except Exception as err:
+            print(f'{self._name} Shared Buffer Error : \n{str(err)}')
+            self.detach_shared_buffers()
+
+    def detach_shared_buffers(self) -> None:
+        if not self._fault_detectable:
+            return
+        self._ring_readers = {}
+        for ring in self._rings.values():
+            ring.close()
+        self._rings = {}
 
-    def register_handler(self, event_handler: EventHandler) -> None:
-        self._event_handlers.append(event_handler)
+    def get_fault_detect_stats(self) -> FaultDetectStats:
+        return replace(self._fault_detect_stats,
+                       RING_LOST=sum(reader.lost for reader in self._ring_readers.values()))
+
+    def register_handler(self,
+                         event_handler: EventHandler,
+                         policy: OverflowPolicy = OverflowPolicy.BLOCK,
+                         maxsize: int = HANDLER_QUEUE_SIZE) -> None:
+        if event_handler in self._dispatchers:
+            return
+        self._dispatchers[event_handler] = Dispatcher(loop=self._loop,
+                                                      name=f'{self._name}.{type(event_handler).__name__}',
+                                                      callback=event_handler.event_handle,
+                                                      maxsize=maxsize,
+                                                      policy=policy,
+                                                      coalesce=_coalesce_events)
 
     def remove_handler(self, event_handler: EventHandler) -> None:
-        if event_handler in self._event_handlers:
-            self._event_handlers.remove(event_handler)
+        if event_handler in self._dispatchers:
+            self._dispatchers.pop(event_handler).close()
 
-    async def data_update(self, device_name: str, named_datas: Dict[str, List[float]]) -> None:
-        named_datas = {sensor: data for sensor, data in named_datas.items() if sensor in self._sensors}
+    def get_handler_stats(self) -> Dict[str, DispatchStats]:
+        return {type(handler).__name__: dispatcher.stats() for handler, dispatcher in self._dispatchers.items()}
 
-        if len(named_datas):
-            await self._event_notify(MachineEvent.DataUpdate, named_datas)
+    async def data_update(self, device_name: str, named_blocks: Dict[str, SampleBlock]) -> None:
+        # DAQ 라우팅으로 이 Machine 의 센서 블록만 전달됨
+        if len(named_blocks):
+            metrics = get_registry()
+            for block in named_blocks.values():
+                metrics.record_since(Stage.DISPATCH, block.acquired, len(block))
+            await self._event_notify(MachineEvent.DataUpdate, named_blocks)
             if self._fault_detectable:
-                await self._fault_detect(named_datas)
-
-    async def _fault_detect(self, named_datas: Dict[str, List[float]]) -> None:
-        is_batch = len(named_datas) != 0
-        for name, data in named_datas.items():
-            if len(self._batches[name]) < self._models[name].batch_size:
-                self._batches[name] += data
-                is_batch = False
-
-        if is_batch:
-            score = 0
-            for name in self._sensors:
-                target = DataFrame()
-                target['data'] = self._batches[name][:self._models[name].batch_size]
-                score += self._models[name].detect(target)
-            self._init_batches()
+                self._fault_detect(named_blocks)
+
+    def _fault_detect(self, named_blocks: Dict[str, SampleBlock]) -> None:
+        # 배치가 채워지면 추론 태스크로 넘기고 바로 반환하므로 데이터 수신이 추론을 기다리지 않음
+        for name, block in named_blocks.items():
+            if not self._batch_acquired:
+                self._batch_acquired = block.acquired
+            if name in self._ring_readers:
+                # DAQ 는 블록을 handler 에 넘기기 전에 ring 에 기록하므로, 아직 전달되지 않은 블록까지 한 번에 읽을 수 있음
+                # ring 의 view 에서 바로 배치 버퍼로 정규화해서 씀
+                _, data = self._ring_readers[name].read_new()
+                self._fault_detect_stats.DROPPED += self._batches[name].append(data)
+            elif name in self._batches:
+                self._fault_detect_stats.DROPPED += self._batches[name].append(block.data)
+
+        if not self._batches or not all(batch.is_full() for batch in self._batches.values()):
+            return
+
+        metrics = get_registry()
+        metrics.record_since(Stage.BATCH_FILL, self._batch_acquired,
+                             sum(self._model_confs[name].BATCH_SIZE for name in self._batches))
+        full = (self._batches, time.monotonic(), False)
+        self._swap_batches(named_blocks)
+
+        if self._prefilter is not None and self._prefilter.is_normal({name: batch.batch() for name, batch in full[0].items()}):
+            if not self._prefilter.should_audit():
+                # 명백한 정상 배치는 추론하지 않고 정상 결과를 바로 알림
+                self._release_batches(full[0])
+                self._fault_detect_stats.GATED += 1
+                self._loop.create_task(self._event_notify(MachineEvent.FaultDetect, {
+                    'score': 0,
+                    'threshold': self._fault_threshold
+                }))
+                return
+            full = (full[0], full[1], True)
+
+        if not self._scoring:
+            self._start_scoring(full)
+        elif self._fault_detect_policy is FaultDetectPolicy.SKIP:
+            self._release_batches(full[0])
+            self._fault_detect_stats.SKIPPED += 1
+        elif self._pending_batches is None:
+            self._pending_batches = full
+        elif self._fault_detect_policy is FaultDetectPolicy.QUEUE:
+            self._release_batches(full[0])
+            self._fault_detect_stats.SKIPPED += 1
+        else:
+            self._release_batches(self._pending_batches[0])
+            self._pending_batches = full
+            self._fault_detect_stats.REPLACED += 1
+
+    def _swap_batches(self, named_blocks: Dict[str, SampleBlock]) -> None:
+        # 다음 배치를 채울 버퍼 묶음으로 바꾸고 넘친 샘플을 옮김
+        # 넘친 샘플은 다음 배치로 이어지므로 다음 배치의 수집 시각은 마지막 블록 기준으로 둠
+        batches = self._free_batches.pop() if self._free_batches else self._create_batches()
+        for name, batch in self._batches.items():
+            batch.carry_to(batches[name])
+        self._batches = batches
+
+        carried = any(len(batch) for batch in self._batches.values())
+        self._batch_acquired = min(block.acquired for block in named_blocks.values()) if carried else 0.0
+
+    def _release_batches(self, batches: Dict[str, BatchBuffer]) -> None:
+        for batch in batches.values():
+            batch.clear()
+        self._free_batches.append(batches)
+
+    def _start_scoring(self, full: Tuple[Dict[str, BatchBuffer], float, bool]) -> None:
+        self._scoring = True
+        self._loop.create_task(self._score(*full))
+
+    async def _score(self, batches: Dict[str, BatchBuffer], completed: float, audit: bool) -> None:
+        # 배치는 버퍼의 view 이며, 추론이 끝나 release 될 때까지 이 버퍼 묶음에는 새 데이터를 쓰지 않음
+        # audit 이면 사전 필터가 정상으로 판단한 배치이므로 추론 결과와 비교함
+        metrics = get_registry()
+        samples = sum(len(batch.batch()) for batch in batches.values())
+        try:
+            begin = time.monotonic()
+            scores = await asyncio.gather(*[self._inference_scheduler.detect(self._model_dir, name, batch.batch(),
+                                                                             batch.is_normalized())
+                                            for name, batch in batches.items()])
+            end = time.monotonic()
+            metrics.record(Stage.INFERENCE, end - begin, samples)
+            metrics.record(Stage.DETECT_LAG, end - completed, samples)
+
+            stats = self._fault_detect_stats
+            stats.SCORED += 1
+            stats.LAG = end - completed
+            stats.MAX_LAG = max(stats.MAX_LAG, stats.LAG)
+            if audit:
+                stats.AUDITED += 1
+                if sum(scores) > self._fault_threshold:
+                    stats.DISAGREED += 1
 
             await self._event_notify(MachineEvent.FaultDetect, {
-                'score': score,
+                'score': sum(scores),
                 'threshold': self._fault_threshold
             })
+        except Exception as err:
+            print(f'{self._name} Fault Detection Error : \n{str(err)}')
+        finally:
+            self._release_batches(batches)
+            self._scoring = False
+            if self._pending_batches is not None:
+                pending, self._pending_batches = self._pending_batches, None
+                self._start_scoring(pending)
 
     async def _event_notify(self, event: MachineEvent, data: Dict) -> None:
-        for handler in self._event_handlers:
-            try:
-                self._loop.create_task(handler.event_handle(event, data))
-            except Exception as err:
-                print(f'Event Handling Error : \n{str(err)}')
+        for dispatcher in list(self._dispatchers.values()):
+            await dispatcher.put(event, data)
+
+
+def _coalesce_events(prev: Tuple[MachineEvent, Dict], new: Tuple[MachineEvent, Dict]) -> Optional[Tuple[MachineEvent, Dict]]:
+    # 같은 종류의 이벤트만 합침, DataUpdate 는 센서별로 이어붙이고 FaultDetect 는 최신 결과만 남김
+    prev_event, prev_data = prev
+    new_event, new_data = new
+    if prev_event is not new_event:
+        return None
+    if new_event is MachineEvent.DataUpdate:
+        return new_event, merge_named_blocks(prev_data, new_data)
+    return new
@@ -3,12 +3,31 @@ from enum import Enum, auto
 from typing import Dict, List
 from dataclasses import dataclass
 
+from lib.lstm_ae.inference_engine import InferenceEngine
+
 
 class NIDeviceType(Enum):
     VIB: int = auto()
     TEMP: int = auto()
 
 
+class DeviceBackend(Enum):
+    NI: int = auto()
+    SIM: int = auto()
+    REPLAY: int = auto()
+
+
+class SaveFormat(Enum):
+    CSV: int = auto()       # 샘플마다 (time, data) 한 줄
+    BINARY: int = auto()    # float32 chunk 파일과 일별 색인 (lib.archive)
+
+
+class FaultDetectPolicy(Enum):
+    SKIP    : int = auto()      # 추론 중에 채워진 배치는 버림
+    QUEUE   : int = auto()      # 한 배치만 대기시키고, 대기 중이면 새 배치를 버림
+    NEWEST  : int = auto()      # 한 배치만 대기시키고, 대기 중이면 최신 배치로 교체함
+
+
 @dataclass
 class SensorConfig:
     NAME        : str
@@ -23,11 +42,16 @@ class NIDeviceConfig:
     RATE        : int
     SENSORS     : List[SensorConfig]
 
+    BACKEND         : DeviceBackend = DeviceBackend.NI
+    BACKEND_OPTIONS : Dict[str, any] = None
+
     def __post_init__(self):
         if isinstance(self.SENSORS, Dict):
             self.SENSORS = [SensorConfig(**sensor_conf) for sensor_conf in self.SENSORS]
         if isinstance(self.TYPE, str):
             self.TYPE = NIDeviceType.__members__[self.TYPE]
+        if isinstance(self.BACKEND, str):
+            self.BACKEND = DeviceBackend.__members__[self.BACKEND]
 
 
 @dataclass
@@ -56,6 +80,12 @@ class DataSendModeConfig(ActivableModeConfig):
 @dataclass
 class DataSaveModeConfig(ActivableModeConfig):
     PATH            : str = ''
+    FORMAT          : SaveFormat = SaveFormat.CSV
+
+    def __post_init__(self):
+        if isinstance(self.FORMAT, str):
+            self.FORMAT = SaveFormat.__members__[self.FORMAT]
+        super().__post_init__()
 
     def valid_check(self) -> None:
         pass
@@ -76,3 +106,16 @@ class MachineConfig:
 class DAQSystemConfig:
     NI_DEVICES          : List[NIDeviceConfig]
     MACHINES            : List[MachineConfig]
+
+    SHARED_BUFFER_SECONDS   : int = 0       # 센서별 공유 메모리 ring buffer 길이, Machine 의 고장 감지 배치를 ring 에서 읽음, 0 이면 사용하지 않음
+    INFERENCE_WORKERS       : int = 1       # 고장 감지 추론 작업 프로세스 수
+    INFERENCE_BATCH_WINDOW  : float = 0.05  # 추론 요청을 모아 한 번에 처리하는 대기 시간 (sec)
+    INFERENCE_ENGINE        : InferenceEngine = InferenceEngine.NUMPY   # NUMPY : TensorFlow 없이 NumPy 로 추론, KERAS : keras 모델로 추론
+    FAULT_DETECT_POLICY     : FaultDetectPolicy = FaultDetectPolicy.NEWEST  # 추론이 밀릴 때 새 배치 처리 방식
+    METRICS_DUMP_INTERVAL   : int = 0       # 단계별 지연 통계를 로그 파일에 남기는 주기 (sec), 0 이면 남기지 않음
+
+    def __post_init__(self):
+        if isinstance(self.INFERENCE_ENGINE, str):
+            self.INFERENCE_ENGINE = InferenceEngine.__members__[self.INFERENCE_ENGINE]
+        if isinstance(self.FAULT_DETECT_POLICY, str):
+            self.FAULT_DETECT_POLICY = FaultDetectPolicy.__members__[self.FAULT_DETECT_POLICY]
@@ -6,6 +6,8 @@ CONFIG_PATH = 'resources/DAQSystem.conf'
 
 MODEL_DIR = 'resources/model'
 DATA_DIR = 'resources/data'
+LOG_DIR = 'resources/log'
+METRICS_LOG = 'resources/log/metrics.log'
 
 ICON_IMG = 'resources/img/icon.png'
 
@@ -1,12 +1,14 @@
 from typing import Dict
 
 from PySide6.QtCore import Signal
-from PySide6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QComboBox, QLabel
+from PySide6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QComboBox, QLabel, QPushButton
 
 from background import DAQSystem
 from background.machine import Machine
 from config import MachineConfig
 from .machine import QMachine
+from .device_status import QDeviceStatus
+from .diagnostics import QDiagnostics
 
 
 class QDAQSystemMonitor(QWidget):
@@ -55,13 +57,24 @@ class QDAQSystemMonitor(QWidget):
         self.header_layout.addWidget(self.drop_down)
         self.header_layout.addStretch()
 
+        self.diagnostics_btn = QPushButton('Diagnostics')
+        self.diagnostics_btn.clicked.connect(self.open_diagnostics)
+        self.header_layout.addWidget(self.diagnostics_btn)
+
     def _init_content(self):
         self.content_layout.setContentsMargins(0, 0, 18, 0)
         self.content_layout.addWidget(self.machine_widget)
 
     def _init_bottom(self):
         self.bottom_layout.setContentsMargins(18, 0, 18, 0)
+        self.device_status = QDeviceStatus(self._bg_system, self)
+        self.bottom_layout.addWidget(self.device_status)
 
     def set_machine(self, machine_name):
         self.machine_widget.set_machine(self._m_confs[machine_name])
         self.set_monitoring_target.emit(self._machines[machine_name])
+
+    def open_diagnostics(self):
+        diagnostics_window = QDiagnostics(self._bg_system)
+        diagnostics_window.setModal(True)
+        diagnostics_window.exec()
@@ -0,0 +1,42 @@
+from typing import Dict
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel
+
+from background import DAQSystem
+from lib.daq import DeviceStats
+
+
+REFRESH_INTERVAL = 1000     # ms
+
+
+class QDeviceStatus(QWidget):
+    """ 장비별 입력 버퍼 상태(backlog, overrun, jitter)를 주기적으로 표시함 """
+    def __init__(self, bg_system: DAQSystem, parent: QWidget):
+        super().__init__(parent)
+        """ Set environ """
+        self._bg_system = bg_system
+        self._labels: Dict[str, QLabel] = {}
+
+        """ Set layout """
+        self.layout = QHBoxLayout(self)
+        self.layout.setContentsMargins(0, 0, 0, 0)
+        self.layout.addStretch()
+
+        """ Set timer """
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start(REFRESH_INTERVAL)
+
+    def refresh(self) -> None:
+        for name, stats in self._bg_system.get_device_stats().items():
+            if name not in self._labels:
+                self._labels[name] = QLabel()
+                self.layout.insertWidget(self.layout.count() - 1, self._labels[name])
+            self._labels[name].setText(self._format(name, stats))
+
+    @staticmethod
+    def _format(name: str, stats: DeviceStats) -> str:
+        buffer = f'{stats.BACKLOG}/{stats.BUFFER_SIZE}' if stats.BUFFER_SIZE else f'{stats.BACKLOG}'
+        return (f'{name} | backlog {buffer} (max {stats.MAX_BACKLOG}) | '
+                f'overruns {stats.OVERRUNS} | read errors {stats.READ_ERRORS} | jitter {stats.JITTER * 1000:.1f} ms')
@@ -0,0 +1,80 @@
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QPalette, QColor
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView, \
+    QAbstractItemView, QPushButton, QLabel
+
+from background import DAQSystem
+from lib.metrics import Stage
+
+REFRESH_INTERVAL = 1000     # ms
+COLUMNS = ['Count', 'Mean (ms)', 'P50 (ms)', 'P95 (ms)', 'P99 (ms)', 'Max (ms)', 'Samples/s']
+
+
+class QDiagnostics(QDialog):
+    """ 단계별 지연 시간 히스토그램 요약을 주기적으로 표시하고 로그 파일로 남길 수 있는 창 """
+    def __init__(self, bg_system: DAQSystem):
+        super().__init__()
+        self._bg_system = bg_system
+
+        """ Window """
+        self.setWindowTitle('Diagnostics')
+        self.setMinimumSize(720, 340)
+        self.palette = QPalette()
+        self.palette.setColor(QPalette.WindowText, QColor(255, 255, 255))
+        self.palette.setColor(QPalette.Window, QColor(72, 72, 72))
+        self.setAutoFillBackground(True)
+        self.setPalette(self.palette)
+
+        """ Init main widget """
+        self.stage_table = QTableWidget(len(Stage), len(COLUMNS))
+        self.fault_detect_label = QLabel()
+        self.dump_btn = QPushButton('Dump to Log')
+        self.close_btn = QPushButton('Close')
+        self._init_main_widget()
+
+        """ Init layout """
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(20, 20, 20, 20)
+        self.bottom_layout = QHBoxLayout()
+        self.bottom_layout.addStretch()
+        self.bottom_layout.addWidget(self.dump_btn)
+        self.bottom_layout.addWidget(self.close_btn)
+
+        self.layout.addWidget(self.stage_table)
+        self.layout.addWidget(self.fault_detect_label)
+        self.layout.addLayout(self.bottom_layout)
+
+        """ Set timer """
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start(REFRESH_INTERVAL)
+        self.refresh()
+
+    def _init_main_widget(self):
+        self.stage_table.setHorizontalHeaderLabels(COLUMNS)
+        self.stage_table.setVerticalHeaderLabels([stage.name for stage in Stage])
+        self.stage_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.stage_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+
+        self.dump_btn.clicked.connect(self.dump)
+        self.close_btn.clicked.connect(self.close)
+
+    def refresh(self):
+        for row, (stage, snap) in enumerate(self._bg_system.get_metrics().items()):
+            values = [f'{snap.COUNT}', f'{snap.MEAN * 1e3:.2f}', f'{snap.P50 * 1e3:.2f}', f'{snap.P95 * 1e3:.2f}',
+                      f'{snap.P99 * 1e3:.2f}', f'{snap.MAX * 1e3:.2f}', f'{snap.THROUGHPUT:.1f}']
+            for col, value in enumerate(values):
+                self.stage_table.setItem(row, col, QTableWidgetItem(value))
+        # 사전 필터가 추론을 생략한 비율, 검증 추론에서 이상으로 나온 횟수, 배치 버퍼가 넘쳐 버린 샘플 수와
+        # 공유 ring buffer 에서 놓친 샘플 수
+        self.fault_detect_label.setText('\n'.join(
+            f'{name} : skip rate {stats.skip_rate() * 100:.1f}% '
+            f'(gated {stats.GATED}, scored {stats.SCORED}), audit disagreement {stats.DISAGREED}/{stats.AUDITED}, '
+            f'dropped samples {stats.DROPPED}, ring lost samples {stats.RING_LOST}'
+            for name, stats in self._bg_system.get_fault_detect_stats().items()))
+
+    def dump(self):
+        try:
+            self._bg_system.dump_metrics()
+        except Exception as err:
+            print(f'Metrics Dump Error : \n{str(err)}')
@@ -9,6 +9,8 @@ from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QVBoxLayout, QStacke
     QHeaderView, QAbstractItemView, QPushButton, QGridLayout
 
 from background.machine.machine_event import MachineEvent
+from lib.daq import SampleBlock
+from lib.metrics import Stage, get_registry
 from config import MachineConfig, DataSaveModeConfig, DataSendModeConfig
 from config.paths import BTN_FOLDER_ENABLE_IMG, BTN_FOLDER_DISABLE_IMG
 from .realtime_chart import QRealtimeChart
@@ -238,12 +240,15 @@ class QMachine(QWidget):
         elif event is MachineEvent.FaultDetect:
             self.e_fault_detect(data)
 
-    def e_data_update(self, named_data: Dict[str, List[float]]) -> None:
-        for name, datas in named_data.items():
+    def e_data_update(self, named_blocks: Dict[str, SampleBlock]) -> None:
+        metrics = get_registry()
+        for name, block in named_blocks.items():
             if name in self.charts:
+                datas = block.data
                 if len(datas) > MAXIMUM_BATCH:
                     datas = signal.resample(datas, MAXIMUM_BATCH)
                 self.charts[name].append_data(datas)
+                metrics.record_since(Stage.GUI_EMIT, block.acquired, len(block))
 
     def e_fault_detect(self, result: Dict[str, int]) -> None:
         self.fd_score_label.setText(f'{result["score"]}')
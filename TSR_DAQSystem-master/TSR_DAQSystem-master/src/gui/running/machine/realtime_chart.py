@@ -1,4 +1,4 @@
-from typing import List
+from typing import Sequence
 
 from PySide6.QtCharts import QChart, QChartView, QValueAxis, QLineSeries
 from PySide6.QtCore import Qt
@@ -40,7 +40,7 @@ class QRealtimeChart(QWidget):
         # Set the layout to the QWidget
         self.setLayout(self.main_layout)
 
-    def append_data(self, datas: List[float]):
+    def append_data(self, datas: Sequence[float]):
         for y in datas:
             self._idx += 1
             self.series.append(self._idx, y)
@@ -0,0 +1,4 @@
+from .chunk_file import ChunkHeader, read_header
+from .archive_writer import ArchiveWriter
+from .archive_reader import ArchiveReader, list_sensors
+from .converter import csv_to_archive, archive_to_csv
@@ -0,0 +1,67 @@
+import os
+import numpy as np
+from typing import List, Optional
+
+from lib.daq import SampleBlock
+from .chunk_file import INDEX_DTYPE, SAMPLE_DTYPE, HEADER_SIZE, chunk_path, index_path, chunk_count
+
+
+class ArchiveReader:
+    """
+        ArchiveWriter 가 저장한 센서 하나의 하루치 chunk 를 memory-map 으로 읽음
+        색인으로 필요한 chunk 만 찾아 열며, 반환하는 data 는 파일의 view 이므로 수정하지 않아야 함
+        기록 중인 chunk 도 읽을 수 있으며, 그 경우 읽는 시점까지 기록된 샘플만 보임
+    """
+    def __init__(self, directory: str, date: str, sensor: str):
+        self._directory = directory
+        self._date = date
+        self._sensor = sensor
+        self._index = np.fromfile(index_path(directory, date, sensor), dtype=INDEX_DTYPE)
+        self._name = os.path.basename(os.path.normpath(directory))
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def chunk(self, idx: int) -> SampleBlock:
+        record = self._index[idx]
+        path = chunk_path(self._directory, self._date, self._sensor, int(record['chunk']))
+        count = int(record['count']) if record['count'] >= 0 else chunk_count(path)
+        data = np.memmap(path, dtype=SAMPLE_DTYPE, mode='r', offset=HEADER_SIZE, shape=(count,)) \
+            if count else np.empty(0, dtype=SAMPLE_DTYPE)
+        return SampleBlock(device=self._name, sensor=self._sensor, start=float(record['start']),
+                           rate=float(record['rate']), data=data)
+
+    def chunks(self) -> List[SampleBlock]:
+        return [self.chunk(idx) for idx in range(len(self))]
+
+    def slices(self, start: Optional[float] = None, end: Optional[float] = None) -> List[SampleBlock]:
+        # [start, end) 시각 (epoch sec) 에 걸친 샘플을 chunk 별 SampleBlock 으로 반환함, 끊긴 구간은 별도 블록이 됨
+        start = -np.inf if start is None else start
+        end = np.inf if end is None else end
+        blocks = []
+        for idx, record in enumerate(self._index):
+            # 색인의 시작 시각만으로 범위 밖 chunk 를 먼저 거름, 끝 시각은 샘플 수를 알아야 하므로 열어서 확인함
+            if record['start'] >= end:
+                continue
+            block = self.chunk(idx)
+            first = max(int(np.ceil((start - block.start) * block.rate)), 0) if np.isfinite(start) else 0
+            last = min(int(np.ceil((end - block.start) * block.rate)), len(block)) if np.isfinite(end) else len(block)
+            if first >= last:
+                continue
+            blocks.append(SampleBlock(device=block.device, sensor=block.sensor, start=block.start + first / block.rate,
+                                      rate=block.rate, data=block.data[first:last]))
+        return blocks
+
+    def read(self, start: Optional[float] = None, end: Optional[float] = None) -> np.ndarray:
+        # 시간 범위의 샘플을 하나의 ndarray 로 이어붙여 반환함 (복사됨)
+        blocks = self.slices(start, end)
+        if not blocks:
+            return np.empty(0, dtype=SAMPLE_DTYPE)
+        return np.concatenate([block.data for block in blocks])
+
+
+def list_sensors(directory: str, date: str) -> List[str]:
+    # directory 에 date 의 색인이 있는 센서 목록
+    prefix = f'{date}_'
+    return sorted(file_name[len(prefix):-len('.idx')] for file_name in os.listdir(directory)
+                  if file_name.startswith(prefix) and file_name.endswith('.idx'))
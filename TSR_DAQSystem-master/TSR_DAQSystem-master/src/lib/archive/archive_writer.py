@@ -0,0 +1,78 @@
+import os
+import numpy as np
+
+from .chunk_file import ChunkHeader, INDEX_DTYPE, SAMPLE_DTYPE, chunk_path, index_path, pack_header
+
+CHUNK_SECONDS: int = 600            # chunk 하나에 담는 시간 (sec), 시간 범위 조회 시 이 단위로 파일을 엶
+FILE_BUFFER_SIZE: int = 1 << 20     # bytes
+
+
+class ArchiveWriter:
+    """
+        센서 하나의 하루치 샘플을 float32 chunk 파일로 저장함
+        chunk 는 같은 rate 의 연속된 샘플만 담으며, CHUNK_SECONDS 가 차거나 샘플이 끊기면 (장비 재시작 등) 새 chunk 를 시작함
+        chunk 를 열 때마다 일별 색인에 (번호, 시작 시각, rate) 를 추가하고 닫을 때 샘플 수를 기록함
+    """
+    def __init__(self, directory: str, date: str, sensor: str, chunk_seconds: int = CHUNK_SECONDS):
+        self._directory = directory
+        self._date = date
+        self._sensor = sensor
+        self._chunk_seconds = chunk_seconds
+
+        # 같은 날 다시 시작한 경우 기존 색인 뒤에 이어서 chunk 를 추가함
+        path = index_path(directory, date, sensor)
+        self._index = open(path, 'r+b' if os.path.isfile(path) else 'w+b')
+        self._index.seek(0, os.SEEK_END)
+        self._next_chunk: int = self._index.tell() // INDEX_DTYPE.itemsize
+
+        self._file = None
+        self._header: ChunkHeader = None
+        self._index_offset: int = 0
+        self._count: int = 0
+
+    def add_data(self, start: float, rate: float, data: np.ndarray) -> None:
+        if not len(data):
+            return
+        if not self._is_continuous(start, rate) or self._count >= self._chunk_seconds * rate:
+            self._open_chunk(start, rate)
+        self._file.write(np.asarray(data, dtype=SAMPLE_DTYPE).tobytes())
+        self._count += len(data)
+
+    def _is_continuous(self, start: float, rate: float) -> bool:
+        # 이어지는 블록의 시작 시각은 chunk 시작 시각 + 샘플 수 / rate 와 반 샘플 이내로 같아야 함
+        if self._file is None or rate != self._header.RATE:
+            return False
+        return abs(start - (self._header.START + self._count / rate)) <= 0.5 / rate
+
+    def _open_chunk(self, start: float, rate: float) -> None:
+        self._close_chunk()
+        chunk = self._next_chunk
+        self._next_chunk += 1
+        self._header = ChunkHeader(START=start, RATE=rate, COUNT=-1)
+        self._count = 0
+
+        self._file = open(chunk_path(self._directory, self._date, self._sensor, chunk), 'wb', buffering=FILE_BUFFER_SIZE)
+        self._file.write(pack_header(self._header))
+
+        self._index_offset = chunk * INDEX_DTYPE.itemsize
+        self._write_index(chunk, -1)
+
+    def _close_chunk(self) -> None:
+        if self._file is None:
+            return
+        self._header.COUNT = self._count
+        self._file.seek(0)
+        self._file.write(pack_header(self._header))
+        self._file.close()
+        self._file = None
+        self._write_index(self._index_offset // INDEX_DTYPE.itemsize, self._count)
+
+    def _write_index(self, chunk: int, count: int) -> None:
+        record = np.array([(chunk, self._header.START, self._header.RATE, count)], dtype=INDEX_DTYPE)
+        self._index.seek(self._index_offset)
+        self._index.write(record.tobytes())
+        self._index.flush()
+
+    def close(self) -> None:
+        self._close_chunk()
+        self._index.close()
@@ -0,0 +1,48 @@
+import os
+import struct
+import numpy as np
+from dataclasses import dataclass
+from typing import Optional
+
+MAGIC: bytes = b'TSRA'
+VERSION: int = 1
+HEADER = struct.Struct('<4sHxxddq')     # magic, version, start (epoch sec), rate, count
+HEADER_SIZE: int = HEADER.size
+SAMPLE_DTYPE = np.dtype('<f4')
+
+# 일별 chunk 색인의 레코드, chunk 를 열 때 count = -1 로 추가하고 닫을 때 실제 샘플 수로 덮어씀
+INDEX_DTYPE = np.dtype([('chunk', '<i4'), ('start', '<f8'), ('rate', '<f8'), ('count', '<i8')])
+
+
+@dataclass
+class ChunkHeader:
+    START   : float     # 첫 샘플의 수집 시각 (epoch sec)
+    RATE    : float
+    COUNT   : int       # 기록 중인 chunk 는 -1
+
+
+def chunk_path(directory: str, date: str, sensor: str, chunk: int) -> str:
+    return os.path.join(directory, f'{date}_{sensor}.{chunk:04d}.f32')
+
+
+def index_path(directory: str, date: str, sensor: str) -> str:
+    return os.path.join(directory, f'{date}_{sensor}.idx')
+
+
+def pack_header(header: ChunkHeader) -> bytes:
+    return HEADER.pack(MAGIC, VERSION, header.START, header.RATE, header.COUNT)
+
+
+def read_header(path: str) -> ChunkHeader:
+    with open(path, 'rb') as file:
+        magic, version, start, rate, count = HEADER.unpack(file.read(HEADER_SIZE))
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f'{path} is not a chunk file')
+    return ChunkHeader(START=start, RATE=rate, COUNT=count)
+
+
+def chunk_count(path: str, header: Optional[ChunkHeader] = None) -> int:
+    # 닫히지 않은 chunk (비정상 종료 포함) 는 파일 크기로 샘플 수를 구함
+    if header is not None and header.COUNT >= 0:
+        return header.COUNT
+    return (os.path.getsize(path) - HEADER_SIZE) // SAMPLE_DTYPE.itemsize
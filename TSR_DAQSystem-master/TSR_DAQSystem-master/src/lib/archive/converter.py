@@ -0,0 +1,95 @@
+import time
+import numpy as np
+from itertools import islice
+from typing import List, Optional
+
+from util.clock import get_times
+from lib.csv_writer import CsvWriter
+from .archive_writer import ArchiveWriter
+from .archive_reader import ArchiveReader
+
+CSV_CHUNK_SAMPLES: int = 1_000_000      # 변환 시 한 번에 읽고 쓰는 샘플 수
+GAP_TOLERANCE: float = 0.002            # sec, CSV 시각은 ms 단위이므로 이웃 샘플 간격 오차가 이보다 크면 끊긴 것으로 봄
+RATE_GAP: float = 0.1                   # sec, rate 추정 시 이보다 벌어진 곳은 끊긴 구간으로 봄
+
+
+def parse_times(times: List[str]) -> np.ndarray:
+    # 'HH:MM:SS.mmm' (이전 형식 'HH:MM:SS' 포함) 문자열을 자정 기준 초로 변환함
+    times = np.array(times)
+    times = np.where(np.char.str_len(times) == 8, np.char.add(times, '.000'), times).astype('U12')
+    digits = times.view(np.uint32).reshape(len(times), 12).astype(np.int64) - ord('0')
+    hours = digits[:, 0] * 10 + digits[:, 1]
+    minutes = digits[:, 3] * 10 + digits[:, 4]
+    seconds = digits[:, 6] * 10 + digits[:, 7]
+    millis = digits[:, 9] * 100 + digits[:, 10] * 10 + digits[:, 11]
+    return hours * 3600.0 + minutes * 60.0 + seconds + millis / 1000.0
+
+
+def infer_rate(times: np.ndarray) -> Optional[float]:
+    # 가장 긴 연속 구간에서 (샘플 순번, 시각) 의 기울기로 추정함, ms 반올림 오차는 최소 제곱으로 평균됨
+    # 정수 Hz 로 반올림하므로 정확한 rate 를 알면 직접 지정하는 것이 좋음
+    bounds = np.concatenate(([0], np.flatnonzero(np.diff(times) > RATE_GAP) + 1, [len(times)]))
+    longest = int(np.argmax(np.diff(bounds)))
+    run = times[bounds[longest]:bounds[longest + 1]]
+    if len(run) < 2 or run[-1] <= run[0]:
+        return None
+    slope = np.polyfit(np.arange(len(run), dtype=np.float64), run - run[0], 1)[0]
+    return float(round(1 / slope))
+
+
+def csv_to_archive(csv_path: str, directory: str, date: str, sensor: str,
+                   rate: Optional[float] = None, tolerance: float = GAP_TOLERANCE) -> int:
+    """
+        DataSaver 의 (time, data) CSV 를 chunk 파일로 변환하고 변환한 샘플 수를 반환함
+        rate 가 없으면 첫 읽기 단위의 시각으로 추정함, 샘플 간격이 tolerance 이상 어긋나면 새 chunk 로 나눔
+    """
+    midnight = time.mktime(time.strptime(date, '%Y%m%d'))
+    writer = ArchiveWriter(directory, date, sensor)
+    total = 0
+    last_time: Optional[float] = None
+    next_start: Optional[float] = None
+    try:
+        with open(csv_path, 'r', newline='') as file:
+            next(file, None)    # header
+            while True:
+                lines = list(islice(file, CSV_CHUNK_SAMPLES))
+                if not lines:
+                    break
+                times = midnight + parse_times([line.split(',', 1)[0] for line in lines])
+                data = np.loadtxt(lines, delimiter=',', usecols=1, dtype=np.float32, ndmin=1)
+                if rate is None:
+                    rate = infer_rate(times)
+                    if rate is None:
+                        raise ValueError(f'{csv_path} : cannot infer rate, set rate')
+
+                # 이전 읽기 단위의 마지막 샘플과도 간격을 비교함
+                steps = np.diff(times, prepend=times[0] - 1 / rate if last_time is None else last_time)
+                breaks = np.flatnonzero(np.abs(steps - 1 / rate) > tolerance)
+                bounds = np.unique(np.concatenate(([0], breaks, [len(data)])))
+                for begin, end in zip(bounds[:-1], bounds[1:]):
+                    # 끊기지 않은 구간은 ms 단위 시각 대신 앞 구간에서 이어지는 시각을 사용함
+                    start = next_start if next_start is not None and begin not in breaks else times[begin]
+                    writer.add_data(start, rate, data[begin:end])
+                    next_start = start + (end - begin) / rate
+                last_time = times[-1]
+                total += len(data)
+    finally:
+        writer.close()
+    return total
+
+
+def archive_to_csv(directory: str, date: str, sensor: str, csv_path: str) -> int:
+    # chunk 파일을 DataSaver 와 같은 (time, data) CSV 로 변환하고 변환한 샘플 수를 반환함
+    writer = CsvWriter(csv_path, ['time', 'data'])
+    total = 0
+    try:
+        for block in ArchiveReader(directory, date, sensor).chunks():
+            for offset in range(0, len(block), CSV_CHUNK_SAMPLES):
+                data = block.data[offset:offset + CSV_CHUNK_SAMPLES]
+                times = get_times(block.start + offset / block.rate, block.rate, len(data))
+                writer.add_datas(list(zip(times.tolist(), data.astype(str).tolist())))
+                writer.wait_writable()
+                total += len(data)
+    finally:
+        writer.close()
+    return total
@@ -1,2 +1,4 @@
 from .daq import DAQ
+from .device import Device, DeviceStats
 from .data_handler import DataHandler
+from .sample_block import SampleBlock, merge_named_blocks
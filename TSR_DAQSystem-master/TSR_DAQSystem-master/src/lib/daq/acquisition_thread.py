@@ -0,0 +1,64 @@
+import asyncio
+from asyncio import AbstractEventLoop
+from concurrent.futures import TimeoutError
+from threading import Thread, Event
+from typing import Dict
+
+from .device import Device
+from .sample_block import SampleBlock
+
+PUT_TIMEOUT: float = 1.0
+MAX_START_RETRY_INTERVAL: float = 30.0     # sec, 장비 시작 재시도 간격 상한
+
+
+class AcquisitionThread(Thread):
+    """
+        장비별 수집 스레드
+        블로킹 read 를 이벤트 루프 밖에서 수행하고, 읽은 블록을 bounded queue 로 루프에 전달함
+        read 는 장비에 다음 블록이 준비될 때까지 블로킹 되므로 별도의 sleep 없이 장비 클럭에 맞춰 동작함
+        queue 가 가득 차면 자리가 날 때까지 대기하므로 느린 소비자는 장비 버퍼 쪽으로 밀려남
+    """
+    def __init__(self, device: Device, loop: AbstractEventLoop, queue: asyncio.Queue):
+        super().__init__(name=f'acquisition-{device.name()}', daemon=True)
+        self._device = device
+        self._loop = loop
+        self._queue = queue
+        self._stop_event = Event()
+
+    def run(self) -> None:
+        if not self._start_device():
+            return
+        while not self._stop_event.is_set():
+            try:
+                named_blocks = self._device.read()
+                self._put(named_blocks)
+            except Exception as err:
+                print(f'Undefined Error : \n{str(err)}')
+                self._stop_event.wait(self._device.period())
+
+    def _start_device(self) -> bool:
+        # 장비 연결이 끊겼거나 채널 설정이 잘못된 경우 로그를 남기고 간격을 늘려가며 다시 시작함
+        # stop 으로 중단되면 False
+        interval = self._device.period()
+        while not self._stop_event.is_set():
+            try:
+                self._device.start()
+                return True
+            except Exception as err:
+                print(f'{self._device.name()} Start Error : \n{str(err)}')
+                self._stop_event.wait(interval)
+                interval = min(interval * 2, MAX_START_RETRY_INTERVAL)
+        return False
+
+    def _put(self, named_blocks: Dict[str, SampleBlock]) -> None:
+        future = asyncio.run_coroutine_threadsafe(self._queue.put(named_blocks), self._loop)
+        while not self._stop_event.is_set():
+            try:
+                future.result(timeout=PUT_TIMEOUT)
+                return
+            except TimeoutError:
+                continue
+        future.cancel()
+
+    def stop(self) -> None:
+        self._stop_event.set()
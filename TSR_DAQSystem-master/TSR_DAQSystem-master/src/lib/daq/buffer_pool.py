@@ -0,0 +1,40 @@
+import sys
+import numpy as np
+from typing import List, Tuple
+
+MAX_BUFFERS: int = 8
+
+
+def _unused_refcount() -> int:
+    # 풀 목록, 반복 변수, getrefcount 인자만 참조하는 상태의 참조 수
+    # 인터프리터 버전마다 다를 수 있으므로 acquire 와 같은 방식으로 직접 측정함
+    buffers = [np.empty(0)]
+    for buffer in buffers:
+        return sys.getrefcount(buffer)
+
+
+class BufferPool:
+    """
+        장비 읽기용 고정 크기 버퍼를 돌려가며 재사용하는 풀
+        SampleBlock 은 버퍼의 행 view 를 그대로 쓰고, view 와 그 slice 는 모두 버퍼를 참조하므로
+        다른 곳에서 참조하지 않는 버퍼만 다시 내줌
+        모든 버퍼가 사용 중이면 새로 할당하며, max_buffers 개까지만 풀에 보관함
+    """
+    def __init__(self, shape: Tuple[int, ...], dtype=np.float64, max_buffers: int = MAX_BUFFERS):
+        self._shape = shape
+        self._dtype = dtype
+        self._max_buffers = max_buffers
+        self._buffers: List[np.ndarray] = []
+        self._unused = _unused_refcount()
+
+    def acquire(self) -> np.ndarray:
+        for buffer in self._buffers:
+            if sys.getrefcount(buffer) <= self._unused:
+                return buffer
+        buffer = np.empty(self._shape, dtype=self._dtype)
+        if len(self._buffers) < self._max_buffers:
+            self._buffers.append(buffer)
+        return buffer
+
+    def __len__(self) -> int:
+        return len(self._buffers)
@@ -1,42 +1,135 @@
-import nidaqmx
+import os
 import asyncio
-from typing import List, Dict
+from typing import List, Dict, Tuple, Optional
 
-from .ni_device import NIDevice
+from .device import Device, DeviceStats
 from .data_handler import DataHandler
+from .sample_block import SampleBlock, merge_named_blocks
+from .acquisition_thread import AcquisitionThread
+from lib.dispatcher import Dispatcher, OverflowPolicy, DispatchStats
+from lib.shm_ring import SharedRingBuffer
+from lib.shm_ring.shared_ring_buffer import shm_name
+
+QUEUE_SIZE: int = 4
+HANDLER_QUEUE_SIZE: int = 4
 
 
 class DAQ:
-    def __init__(self, ni_devices: List[NIDevice]):
-        self._ni_devices: List[NIDevice] = ni_devices
+    def __init__(self, ni_devices: List[Device], shared_buffer_seconds: int = 0):
+        self._ni_devices: List[Device] = ni_devices
+        self._shared_buffer_seconds: int = shared_buffer_seconds
+        self._rings: Dict[str, SharedRingBuffer] = {}
         self._data_handlers: List[DataHandler] = []
+        self._dispatchers: Dict[DataHandler, Dispatcher] = {}
+        # 장비 이름 -> (handler, 해당 장비에서 handler 가 받을 센서 목록)
+        self._routes: Dict[str, List[Tuple[DataHandler, List[str]]]] = {}
+        self._threads: List[AcquisitionThread] = []
         self._loop = asyncio.get_event_loop()
 
-    def register_data_handler(self, data_handler: DataHandler) -> None:
+    def register_data_handler(self,
+                              data_handler: DataHandler,
+                              policy: OverflowPolicy = OverflowPolicy.BLOCK,
+                              maxsize: int = HANDLER_QUEUE_SIZE) -> None:
+        if data_handler in self._dispatchers:
+            return
         self._data_handlers.append(data_handler)
+        self._dispatchers[data_handler] = Dispatcher(loop=self._loop,
+                                                     name=f'DAQ.{type(data_handler).__name__}',
+                                                     callback=data_handler.data_update,
+                                                     maxsize=maxsize,
+                                                     policy=policy,
+                                                     coalesce=_coalesce_blocks)
+        self._build_routes()
 
     def remove_data_handler(self, data_handler: DataHandler) -> None:
         if data_handler in self._data_handlers:
             self._data_handlers.remove(data_handler)
+            self._dispatchers.pop(data_handler).close()
+            self._build_routes()
+
+    def _build_routes(self) -> None:
+        # 등록 시점에 장비별 라우팅 테이블을 만들어 두고, 블록마다 받을 센서가 있는 handler 에게만 전달함
+        routes = {}
+        for ni_device in self._ni_devices:
+            device_sensors = ni_device.sensor_names()
+            routes[ni_device.name()] = []
+            for handler in self._data_handlers:
+                handler_sensors = handler.get_sensors()
+                if handler_sensors is None:
+                    sensors = list(device_sensors)
+                else:
+                    handler_sensors = set(handler_sensors)
+                    sensors = [sensor for sensor in device_sensors if sensor in handler_sensors]
+                if sensors:
+                    routes[ni_device.name()].append((handler, sensors))
+        self._routes = routes
 
     def read_start(self) -> None:
+        if self._shared_buffer_seconds > 0:
+            self._init_rings()
+
         for ni_device in self._ni_devices:
-            self._loop.create_task(self._read_loop(ni_device))
+            queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+            thread = AcquisitionThread(device=ni_device, loop=self._loop, queue=queue)
+            self._threads.append(thread)
+            self._loop.create_task(self._read_loop(ni_device, queue))
+            thread.start()
+
+    def read_stop(self) -> None:
+        for thread in self._threads:
+            thread.stop()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
 
-    async def _read_loop(self, device: NIDevice) -> None:
+        for ni_device in self._ni_devices:
+            ni_device.close()
+
+        for ring in self._rings.values():
+            ring.close()
+        self._rings = {}
+
+    def _init_rings(self) -> None:
+        # 센서별 블록을 공유 메모리에 한 번만 기록하여 다른 프로세스의 소비자도 복사 없이 읽을 수 있게 함
+        prefix = f'daq{os.getpid()}'
+        for ni_device in self._ni_devices:
+            capacity = ni_device.rate() * self._shared_buffer_seconds
+            for sensor in ni_device.sensor_names():
+                self._rings[sensor] = SharedRingBuffer.create(name=shm_name(prefix, sensor), capacity=capacity)
+
+    def get_shared_buffer_names(self) -> Dict[str, str]:
+        return {sensor: ring.name() for sensor, ring in self._rings.items()}
+
+    def get_device_stats(self) -> Dict[str, DeviceStats]:
+        return {ni_device.name(): ni_device.stats() for ni_device in self._ni_devices}
+
+    def get_handler_stats(self, data_handler: DataHandler) -> DispatchStats:
+        return self._dispatchers[data_handler].stats()
+
+    async def _read_loop(self, device: Device, queue: asyncio.Queue) -> None:
+        # 블록 하나의 처리 실패로 이 장비의 전달 태스크가 끝나면 수집 스레드가 채우는 queue 를 아무도 비우지 않으므로
+        # 오류는 출력하고 다음 블록을 계속 처리함
         while True:
+            named_blocks = await queue.get()
             try:
-                named_datas = await device.read()
-                self._loop.create_task(self._data_notify(device.name(), named_datas))
-                await asyncio.sleep(1)
-            except nidaqmx.errors.DaqReadError:
-                pass
+                if self._rings:
+                    for sensor, block in named_blocks.items():
+                        block.seq = self._rings[sensor].write(block.data)
+                await self._data_notify(device.name(), named_blocks)
             except Exception as err:
-                print(f'Undefined Error : \n{str(err)}')
+                print(f'{device.name()} Data Delivery Error : \n{str(err)}')
 
-    async def _data_notify(self, device_name: str, named_datas: Dict[str, List[float]]) -> None:
-        for handler in self._data_handlers:
-            try:
-                self._loop.create_task(handler.data_update(device_name, named_datas))
-            except Exception as err:
-                print(f'Data Handling Error : \n{str(err)}')
+    async def _data_notify(self, device_name: str, named_blocks: Dict[str, SampleBlock]) -> None:
+        # BLOCK 정책의 handler 가 밀리면 여기서 대기하며, 그 압력은 수집 queue 와 장비 버퍼로 전달됨
+        for handler, sensors in self._routes.get(device_name, []):
+            routed_blocks = {sensor: named_blocks[sensor] for sensor in sensors}
+            await self._dispatchers[handler].put(device_name, routed_blocks)
+
+
+def _coalesce_blocks(prev: Tuple[str, Dict[str, SampleBlock]],
+                     new: Tuple[str, Dict[str, SampleBlock]]) -> Optional[Tuple[str, Dict[str, SampleBlock]]]:
+    prev_device, prev_blocks = prev
+    new_device, new_blocks = new
+    if prev_device != new_device:
+        return None
+    return new_device, merge_named_blocks(prev_blocks, new_blocks)
@@ -1,8 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import Dict, List, Optional
+
+from .sample_block import SampleBlock
 
 
 class DataHandler(ABC):
     @abstractmethod
-    async def data_update(self, device_name: str, named_datas: Dict[str, List[float]]) -> None:
+    async def data_update(self, device_name: str, named_blocks: Dict[str, SampleBlock]) -> None:
         pass
+
+    def get_sensors(self) -> Optional[List[str]]:
+        # DAQ 는 여기서 반환한 센서의 블록만 전달함, None 이면 장비의 모든 센서를 전달함
+        return None
@@ -0,0 +1,118 @@
+import time
+import numpy as np
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, replace
+from typing import List, Dict
+
+from lib.metrics import Stage, get_registry
+from .sample_block import SampleBlock
+from .resampler import StreamResampler
+
+
+JITTER_SMOOTHING: float = 0.1
+
+
+@dataclass
+class DeviceStats:
+    BLOCKS      : int = 0       # 읽은 블록 수
+    BACKLOG     : int = 0       # 읽은 직후 장비 버퍼에 남아있는 채널별 샘플 수
+    MAX_BACKLOG : int = 0       # 관측된 최대 BACKLOG
+    OVERRUNS    : int = 0       # 장비 버퍼가 넘쳐 데이터가 유실된 횟수
+    READ_ERRORS : int = 0       # 오버런 이외의 읽기 오류 횟수
+    BUFFER_SIZE : int = 0       # 장비 입력 버퍼 크기 (채널별 샘플 수)
+    JITTER      : float = 0.0   # 블록 읽기 간격이 블록 길이에서 벗어난 정도의 평균 (sec)
+
+
+class Device(ABC):
+    def __init__(self, name: str, rate: int, real_rate: int):
+        self._name: str = name
+        self._rate: int = rate
+        self._real_rate: int = real_rate
+        self._sensor_names: List[str] = []
+        self._stats: DeviceStats = DeviceStats()
+        self._next_block_time: float = None
+        self._start_time: float = None
+        self._sample_count: int = 0
+        self._resampler: StreamResampler = None
+        self._last_read_time: float = None
+
+    @abstractmethod
+    def add_sensor(self, sensor_name: str, channel: str, options: Dict[str, any]) -> None:
+        pass
+
+    @abstractmethod
+    def _read_raw(self) -> np.ndarray:
+        # 센서 등록 순서대로 (채널 수, real_rate) 형태의 float64 배열을 반환해야 함
+        # 수집 스레드에서 호출되며, 다음 블록이 준비될 때까지 블로킹 되어야 함
+        pass
+
+    def start(self) -> None:
+        self._next_block_time = time.monotonic()
+        self._reset_clock()
+
+    def _reset_clock(self) -> None:
+        # 수집이 (재)시작된 시각을 기준으로 블록 시작 시각을 출력 샘플 수로 계산함
+        # 연속성이 끊긴 경우이므로 리샘플러 상태도 새로 시작함
+        self._start_time = time.time()
+        self._sample_count = 0
+        self._last_read_time = None
+        if self._real_rate != self._rate:
+            self._resampler = StreamResampler(self._real_rate, self._rate, len(self._sensor_names))
+
+    def read(self) -> Dict[str, SampleBlock]:
+        metrics = get_registry()
+        begin = time.monotonic()
+        raw = self._read_raw()
+        acquired = time.monotonic()
+        metrics.record(Stage.READ, acquired - begin, raw.size)
+        self._update_stats()
+
+        if self._resampler is not None:
+            with metrics.timer(Stage.RESAMPLE, raw.size):
+                raw = self._resampler.process(raw)
+        start = self._start_time + self._sample_count / self._rate
+        self._sample_count += raw.shape[1]
+
+        return {sensor: SampleBlock(device=self._name, sensor=sensor, start=start, rate=self._rate, data=data,
+                                    acquired=acquired)
+                for sensor, data in zip(self._sensor_names, raw)}
+
+    def _update_stats(self) -> None:
+        # 블록 간격의 기준은 장비의 블록 주기이며, 재생 속도를 바꾼 장비는 블록 길이와 주기가 다름
+        now = time.monotonic()
+        if self._last_read_time is not None:
+            deviation = abs(now - self._last_read_time - self.period())
+            self._stats.JITTER += JITTER_SMOOTHING * (deviation - self._stats.JITTER)
+        self._last_read_time = now
+
+        self._stats.BLOCKS += 1
+        self._stats.MAX_BACKLOG = max(self._stats.MAX_BACKLOG, self._stats.BACKLOG)
+
+    def _wait_next_block(self) -> None:
+        # 하드웨어 클럭이 없는 장비용, 시작 시점 기준으로 period 마다 블록이 준비되도록 대기함
+        # 누적 기준 시각을 사용하므로 읽기 시간이 쌓여 주기가 밀리지 않음
+        self._next_block_time += self.period()
+        delay = self._next_block_time - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+            self._stats.BACKLOG = 0
+        else:
+            self._stats.BACKLOG = int(-delay / self.period()) * self._real_rate
+
+    def period(self) -> float:
+        return 1.0
+
+    def stats(self) -> DeviceStats:
+        return replace(self._stats)
+
+    def close(self) -> None:
+        pass
+
+    def name(self) -> str:
+        return self._name
+
+    def rate(self) -> int:
+        return self._rate
+
+    def sensor_names(self) -> List[str]:
+        return self._sensor_names
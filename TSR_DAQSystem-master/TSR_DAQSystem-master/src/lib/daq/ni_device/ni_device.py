@@ -1,25 +1,33 @@
+import time
+import numpy as np
 import nidaqmx
 import nidaqmx.constants
-from scipy import signal
-from typing import List, Dict
+import nidaqmx.errors
+from nidaqmx.stream_readers import AnalogMultiChannelReader
+from typing import Dict
 
+from ..device import Device
+from ..buffer_pool import BufferPool
 from .channel_initializers import ChannelInitializer
 
 MIN_RATE: int = 3000
+MIN_BUFFER_BLOCKS: int = 2                  # 입력 버퍼는 최소 블록 2개 분량
+JITTER_MARGIN: float = 4.0                  # 관측된 jitter 의 몇 배를 버퍼 여유분으로 둘지
+MAX_BUFFER_SAMPLES: int = 20_000_000        # 전체 채널 합산 입력 버퍼 상한 (샘플 수)
+OVERWRITE_ERROR_CODE: int = -200279         # DAQmxErrors.SAMPLES_NO_LONGER_AVAILABLE, 읽기 전에 버퍼가 덮어쓰임
 
 
-class NIDevice:
+class NIDevice(Device):
     def __init__(self,
                  name,
                  rate,
                  channel_initializer: ChannelInitializer):
-        self._name: str = name
-        self._rate: int = rate
-        self._real_rate: int = rate if rate > MIN_RATE else MIN_RATE
-        self._sensor_names: List[str] = []
-        self._is_single_channel = False
-
+        super().__init__(name=name,
+                         rate=rate,
+                         real_rate=rate if rate > MIN_RATE else MIN_RATE)
         self._task = nidaqmx.Task()
+        self._reader: AnalogMultiChannelReader = None
+        self._buffers: BufferPool = None
         self._channel_initializer = channel_initializer
 
     def _set_timing(self, rate: int, samples_per_channel: int) -> None:
@@ -33,17 +41,61 @@ class NIDevice:
         self._channel_initializer.add_channel(self._task, physical_channel, **options)
 
         self._sensor_names.append(sensor_name)
-        self._is_single_channel = len(self._sensor_names) == 1
 
-        self._set_timing(rate=self._real_rate,
-                         samples_per_channel=self._real_rate*2)
+    def _buffer_size(self) -> int:
+        # 채널별 버퍼 크기를 rate, 관측된 jitter / backlog 를 바탕으로 정하고, 채널 수에 따라 전체 상한을 둠
+        min_size = self._real_rate * MIN_BUFFER_BLOCKS
+        size = min_size + int(JITTER_MARGIN * self._stats.JITTER * self._real_rate) + 2 * self._stats.MAX_BACKLOG
+        if self._stats.OVERRUNS:
+            size = max(size, self._stats.BUFFER_SIZE * 2)
+        limit = max(MAX_BUFFER_SAMPLES // max(len(self._sensor_names), 1), min_size)
+        return min(size, limit)
+
+    def _configure_buffer(self) -> None:
+        size = self._buffer_size()
+        self._set_timing(rate=self._real_rate, samples_per_channel=size)
+        self._task.in_stream.input_buf_size = size
+        self._stats.BUFFER_SIZE = size
+
+    def start(self) -> None:
+        super().start()
+        self._buffers = BufferPool((len(self._sensor_names), self._real_rate))
+        self._configure_buffer()
+        self._reader = AnalogMultiChannelReader(self._task.in_stream)
+        self._task.start()
+
+    def _wait_available(self, samples_per_channel: int) -> None:
+        # 장비 버퍼에 한 블록이 쌓일 때까지 남은 샘플 수만큼 대기함 (하드웨어 클럭 기준 주기)
+        while True:
+            available = self._task.in_stream.avail_samp_per_chan
+            if available >= samples_per_channel:
+                return
+            time.sleep((samples_per_channel - available) / self._real_rate)
 
-    async def read(self) -> Dict[str, List[float]]:
-        data_list = self._task.read(number_of_samples_per_channel=self._real_rate)
-        data_list = [data_list] if self._is_single_channel else data_list
-        data_list = [signal.resample(data, self._rate).tolist() for data in data_list]
-        named_datas = dict(zip(self._sensor_names, data_list))
-        return named_datas
+    def _read_raw(self) -> np.ndarray:
+        # 풀에서 미리 할당된 버퍼를 받아 드라이버가 그 위에 직접 쓰도록 함
+        # 각 센서의 SampleBlock 은 이 버퍼의 행 view 를 그대로 사용하며, 모든 view 가 해제되면 버퍼가 재사용됨
+        buffer = self._buffers.acquire()
+        while True:
+            try:
+                self._wait_available(self._real_rate)
+                self._reader.read_many_sample(buffer, number_of_samples_per_channel=self._real_rate)
+                self._stats.BACKLOG = self._task.in_stream.avail_samp_per_chan
+                return buffer
+            except nidaqmx.errors.DaqReadError as err:
+                self._task.stop()
+                if err.error_code == OVERWRITE_ERROR_CODE:
+                    # 버퍼 오버런 시 버퍼를 키워 태스크를 재시작하고 수집을 이어감
+                    self._stats.OVERRUNS += 1
+                    print(f'{self._name} Overrun : \n{str(err)}')
+                    self._configure_buffer()
+                else:
+                    # 버퍼 크기와 무관한 오류이므로 버퍼는 그대로 두고 한 주기 뒤에 재시작함
+                    self._stats.READ_ERRORS += 1
+                    print(f'{self._name} Read Error : \n{str(err)}')
+                    time.sleep(self.period())
+                self._task.start()
+                self._reset_clock()
 
-    def name(self) -> str:
-        return self._name
+    def close(self) -> None:
+        self._task.close()
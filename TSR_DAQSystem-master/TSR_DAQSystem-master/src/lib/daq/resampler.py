@@ -0,0 +1,144 @@
+import numpy as np
+from math import gcd
+from functools import lru_cache
+from typing import List, Tuple
+from scipy import signal
+
+KAISER_BETA: float = 5.0
+HALF_LEN_FACTOR: int = 5            # 마지막 polyphase 단계의 필터 반길이 = HALF_LEN_FACTOR * max(up, down)
+MAX_STAGE_FACTOR: int = 100         # 정수 decimation 한 단계에서 줄이는 최대 배율
+
+
+def split_ratio(real_rate: int, rate: int) -> Tuple[List[int], int, int]:
+    # real_rate -> rate 를 정수 decimation 단계들과 마지막 유리수 비율 (up, down) 로 나눔
+    # 마지막 단계 입력 rate (real_rate / 정수 배율) 가 rate 이상으로 남는 범위에서 정수 배율을 최대로 함
+    g = gcd(real_rate, rate)
+    up, down = rate // g, real_rate // g
+    decimation = max((d for d in range(1, down + 1) if down % d == 0 and down // d >= up), default=1)
+
+    stages = []
+    remain = decimation
+    while remain > 1:
+        factor = max(f for f in range(1, MAX_STAGE_FACTOR + 1) if remain % f == 0)
+        if factor == 1:
+            # MAX_STAGE_FACTOR 보다 큰 소인수는 한 단계로 처리함
+            factor = min(f for f in range(2, remain + 1) if remain % f == 0)
+        stages.append(factor)
+        remain //= factor
+    return stages, up, down // decimation
+
+
+@lru_cache(maxsize=None)
+def design_decimation(factor: int) -> np.ndarray:
+    # 정수 decimation 용 FIR 을 (위상별 탭 수, factor) 로 나눈 polyphase 계수
+    # phases[j, p] 는 출력 샘플 기준 j 그룹 전의 입력 그룹에서 p 번째 샘플에 곱할 계수
+    n_phase_taps = 2 * HALF_LEN_FACTOR
+    taps = signal.firwin(n_phase_taps * factor, 1.0 / factor, window=('kaiser', KAISER_BETA))
+    phases = np.ascontiguousarray(taps.reshape(n_phase_taps, factor)[:, ::-1])
+    phases.setflags(write=False)
+    return phases
+
+
+@lru_cache(maxsize=None)
+def design_filter(up: int, down: int) -> np.ndarray:
+    # resample_poly 와 같은 형태의 anti-aliasing FIR, 정수 단계 뒤에 남은 작은 비율에만 사용하므로 필터가 짧음
+    max_rate = max(up, down)
+    half_len = HALF_LEN_FACTOR * max_rate
+    taps = signal.firwin(2 * half_len + 1, 1.0 / max_rate, window=('kaiser', KAISER_BETA)) * up
+    taps.setflags(write=False)
+    return taps
+
+
+class DecimationStage:
+    """
+        FIR low-pass 후 factor 샘플마다 하나를 남기는 정수 decimation
+        입력을 factor 개씩 묶은 (채널, 그룹, factor) 배열에 위상별 계수를 행렬곱하므로 남길 출력만 계산함
+        직전 블록의 입력 그룹과 factor 로 나누어 떨어지지 않은 나머지 샘플을 블록 사이에 유지함
+    """
+    def __init__(self, factor: int):
+        self._factor = factor
+        self._phases = design_decimation(factor)
+        self._pending: np.ndarray = None
+
+    def process(self, data: np.ndarray) -> np.ndarray:
+        factor = self._factor
+        n_phase_taps = self._phases.shape[0]
+        if self._pending is None:
+            # 첫 샘플 값이 이전부터 이어진 것으로 보고 필터 상태를 채움
+            self._pending = np.repeat(data[:, :1], (n_phase_taps - 1) * factor, axis=1)
+
+        pending = np.concatenate((self._pending, data), axis=1)
+        n_groups = pending.shape[1] // factor
+        n_out = n_groups - n_phase_taps + 1
+        groups = pending[:, :n_groups * factor].reshape(pending.shape[0], n_groups, factor)
+
+        # 출력 m 은 그룹 m + n_phase_taps - 1 의 마지막 샘플 위치에서의 causal 필터 출력
+        out = groups[:, n_phase_taps - 1:, :] @ self._phases[0]
+        for j in range(1, n_phase_taps):
+            out += groups[:, n_phase_taps - 1 - j:n_groups - j, :] @ self._phases[j]
+
+        self._pending = pending[:, n_out * factor:]
+        return out
+
+
+class PolyphaseStage:
+    """
+        up / down 유리수 비율의 polyphase FIR, 직전 블록의 입력 일부를 필터 상태로 유지함
+        출력 샘플 n 은 업샘플 도메인 인덱스 n * down 에 해당하는 causal 필터 출력이므로 블록마다 바로 출력이 나옴
+    """
+    def __init__(self, up: int, down: int):
+        self._up, self._down = up, down
+        self._taps = design_filter(up, down)
+        self._history_len = -(-len(self._taps) // up) + down
+        self._history: np.ndarray = None
+        self._in_count = 0
+        self._out_count = 0
+
+    def process(self, data: np.ndarray) -> np.ndarray:
+        up, down = self._up, self._down
+        if self._history is None:
+            # 첫 샘플 값이 이전부터 이어진 것으로 보고 필터 상태를 채움
+            self._history = np.repeat(data[:, :1], self._history_len, axis=1)
+        in_end = self._in_count + data.shape[1]
+
+        # 입력 시작 인덱스 s 가 s * up ≡ 0 (mod down) 을 만족하도록 history 길이를 맞추면
+        # upfirdn 출력 인덱스가 곧바로 전역 출력 인덱스와 정렬됨
+        history_len = self._history_len - down
+        start = self._in_count - history_len
+        while (start * up) % down:
+            history_len += 1
+            start -= 1
+
+        extended = np.concatenate((self._history[:, self._history_len - history_len:], data), axis=1)
+        filtered = signal.upfirdn(self._taps, extended, up=up, down=down, axis=1)
+
+        first = (start * up) // down
+        out_end = -(-(in_end * up) // down)
+        out = filtered[:, self._out_count - first:out_end - first]
+
+        self._history = extended[:, -self._history_len:]
+        self._in_count = in_end
+        self._out_count = out_end
+        return out
+
+
+class StreamResampler:
+    """
+        블록 단위로 들어오는 연속 신호를 real_rate -> rate 로 변환하는 다단계 리샘플러
+        정수 배율은 polyphase FIR decimation 단계로 줄이고, 남은 작은 유리수 비율만 짧은 polyphase FIR 로 처리하므로
+        rate 가 낮아도 필터 길이가 커지지 않음
+        필터 상태를 블록 사이에 유지하므로 블록 경계에서 끊김 없이 이어지며, 첫 블록부터 출력이 나옴
+        causal 필터이므로 출력은 필터의 group delay 만큼 늦은 신호이고, 블록당 출력 개수는 rate 를 기준으로 ±1 변할 수 있음
+
+        data : (채널 수, 샘플 수) 형태로 여러 채널을 한 번에 처리함
+    """
+    def __init__(self, real_rate: int, rate: int, channels: int):
+        factors, up, down = split_ratio(real_rate, rate)
+        self._stages = [DecimationStage(factor) for factor in factors]
+        if up != down:
+            self._stages.append(PolyphaseStage(up, down))
+
+    def process(self, data: np.ndarray) -> np.ndarray:
+        for stage in self._stages:
+            data = stage.process(data)
+        return data
@@ -0,0 +1,38 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict
+
+
+@dataclass
+class SampleBlock:
+    """
+        장비에서 한 번에 읽은 센서 하나의 샘플 묶음
+        data 는 장비가 읽은 버퍼의 view 이므로 소비자는 수정하지 않아야 함
+    """
+    device  : str
+    sensor  : str
+    start   : float         # 첫 샘플의 수집 시각 (epoch sec)
+    rate    : int
+    data    : np.ndarray
+    seq     : int = -1      # 공유 ring buffer 상의 첫 샘플 sequence 번호, 사용하지 않으면 -1
+    acquired: float = 0.0   # 장비에서 읽기를 마친 시각 (time.monotonic), 단계별 지연 시간 측정용
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def concat(self, other: 'SampleBlock') -> 'SampleBlock':
+        # 같은 센서의 연속된 다음 블록을 이어붙인 새 블록을 반환함
+        return SampleBlock(device=self.device,
+                           sensor=self.sensor,
+                           start=self.start,
+                           rate=self.rate,
+                           data=np.concatenate((self.data, other.data)),
+                           seq=self.seq,
+                           acquired=self.acquired)
+
+
+def merge_named_blocks(prev: Dict[str, SampleBlock], new: Dict[str, SampleBlock]) -> Dict[str, SampleBlock]:
+    merged = dict(prev)
+    for sensor, block in new.items():
+        merged[sensor] = merged[sensor].concat(block) if sensor in merged else block
+    return merged
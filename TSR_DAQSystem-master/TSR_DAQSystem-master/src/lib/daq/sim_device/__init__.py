@@ -0,0 +1,2 @@
+from .sim_device import SimDevice
+from .replay_device import ReplayDevice
@@ -0,0 +1,65 @@
+import os
+import csv
+import numpy as np
+from typing import List, Dict, TextIO
+
+from ..device import Device
+
+
+class ReplayDevice(Device):
+    """
+        DataSaver 가 저장한 일별 CSV ({path}/{date}_{sensor}.csv) 를 재생하는 가상 장비
+        저장된 데이터는 이미 rate 로 리샘플링 되어있으므로 rate 단위로 읽음
+        speed 배속으로 재생하며, 파일 끝에 도달하면 처음부터 다시 재생함
+
+        센서 옵션
+            source  : 재생할 센서 이름 (기본값 : 등록한 센서 이름)
+    """
+    def __init__(self, name: str, rate: int, path: str, date: str, speed: float = 1.0):
+        super().__init__(name=name, rate=rate, real_rate=rate)
+        self._path = path
+        self._date = date
+        self._speed = speed
+
+        self._files: List[TextIO] = []
+        self._readers: List[csv.reader] = []
+
+    def add_sensor(self, sensor_name, channel, options: Dict[str, any]) -> None:
+        source = options.get('source', sensor_name)
+        file = open(os.path.join(self._path, f'{self._date}_{source}.csv'), 'r', newline='')
+        self._files.append(file)
+        self._readers.append(self._open_reader(file))
+        self._sensor_names.append(sensor_name)
+
+    @staticmethod
+    def _open_reader(file: TextIO) -> csv.reader:
+        file.seek(0)
+        reader = csv.reader(file)
+        next(reader, None)
+        return reader
+
+    def _read_channel(self, idx: int) -> List[float]:
+        datas = []
+        is_rewound = False
+        while len(datas) < self._real_rate:
+            row = next(self._readers[idx], None)
+            if row is None:
+                if is_rewound:
+                    raise RuntimeError(f'empty replay file : {self._files[idx].name}')
+                self._readers[idx] = self._open_reader(self._files[idx])
+                is_rewound = True
+                continue
+            is_rewound = False
+            datas.append(float(row[1]))
+        return datas
+
+    def _read_raw(self) -> np.ndarray:
+        self._wait_next_block()
+        return np.array([self._read_channel(idx) for idx in range(len(self._sensor_names))], dtype=np.float64)
+
+    def period(self) -> float:
+        return 1.0 / self._speed
+
+    def close(self) -> None:
+        for file in self._files:
+            file.close()
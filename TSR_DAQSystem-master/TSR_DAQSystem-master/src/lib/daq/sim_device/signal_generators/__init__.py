@@ -0,0 +1,5 @@
+from .signal_generator import SignalGenerator
+
+from .sine_generator import SineGenerator
+from .noise_generator import NoiseGenerator
+from .impulse_generator import ImpulseGenerator
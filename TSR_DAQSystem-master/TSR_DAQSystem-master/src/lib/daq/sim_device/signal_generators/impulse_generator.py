@@ -0,0 +1,13 @@
+import numpy as np
+
+from .signal_generator import SignalGenerator
+
+
+class ImpulseGenerator(SignalGenerator):
+    def __init__(self, interval: float, amplitude: float):
+        self._interval = interval
+        self._amplitude = amplitude
+
+    def generate(self, indices: np.ndarray, rate: int) -> np.ndarray:
+        period = max(int(self._interval * rate), 1)
+        return np.where(indices % period == 0, self._amplitude, 0.0)
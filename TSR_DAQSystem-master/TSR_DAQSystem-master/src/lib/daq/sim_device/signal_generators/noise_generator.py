@@ -0,0 +1,12 @@
+import numpy as np
+
+from .signal_generator import SignalGenerator
+
+
+class NoiseGenerator(SignalGenerator):
+    def __init__(self, std: float, rng: np.random.Generator):
+        self._std = std
+        self._rng = rng
+
+    def generate(self, indices: np.ndarray, rate: int) -> np.ndarray:
+        return self._rng.normal(0.0, self._std, len(indices))
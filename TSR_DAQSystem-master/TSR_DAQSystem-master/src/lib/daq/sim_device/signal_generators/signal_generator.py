@@ -0,0 +1,9 @@
+import numpy as np
+from abc import ABC, abstractmethod
+
+
+class SignalGenerator(ABC):
+    @abstractmethod
+    def generate(self, indices: np.ndarray, rate: int) -> np.ndarray:
+        # indices : 수집 시작 시점부터의 샘플 번호
+        pass
@@ -0,0 +1,13 @@
+import numpy as np
+
+from .signal_generator import SignalGenerator
+
+
+class SineGenerator(SignalGenerator):
+    def __init__(self, frequency: float, amplitude: float, phase: float = 0.0):
+        self._frequency = frequency
+        self._amplitude = amplitude
+        self._phase = phase
+
+    def generate(self, indices: np.ndarray, rate: int) -> np.ndarray:
+        return self._amplitude * np.sin(2 * np.pi * self._frequency * indices / rate + self._phase)
@@ -0,0 +1,54 @@
+import numpy as np
+from typing import List, Dict
+
+from ..device import Device
+from ..ni_device.ni_device import MIN_RATE
+from .signal_generators import SignalGenerator, SineGenerator, NoiseGenerator, ImpulseGenerator
+
+DEFAULT_FREQUENCY: float = 50.0
+DEFAULT_AMPLITUDE: float = 1.0
+DEFAULT_NOISE: float = 0.1
+
+
+class SimDevice(Device):
+    """
+        NI 장비 없이 수집 파이프라인을 구동하기 위한 가상 장비
+        NIDevice 와 동일하게 MIN_RATE 이상으로 샘플링한 뒤 rate 로 리샘플링함
+
+        센서 옵션
+            frequency, amplitude    : 정현파 (Hz, 진폭)
+            noise                   : 가우시안 노이즈 표준편차
+            impulse_interval        : 충격 신호 주기 (초), impulse_amplitude : 충격 신호 크기
+    """
+    def __init__(self, name: str, rate: int, seed: int = None):
+        super().__init__(name=name,
+                         rate=rate,
+                         real_rate=rate if rate > MIN_RATE else MIN_RATE)
+        self._rng = np.random.default_rng(seed)
+        self._generators: List[List[SignalGenerator]] = []
+        self._sample_idx: int = 0
+
+    def add_sensor(self, sensor_name, channel, options: Dict[str, any]) -> None:
+        generators: List[SignalGenerator] = [
+            SineGenerator(frequency=options.get('frequency', DEFAULT_FREQUENCY),
+                          amplitude=options.get('amplitude', DEFAULT_AMPLITUDE),
+                          phase=self._rng.uniform(0, 2 * np.pi)),
+            NoiseGenerator(std=options.get('noise', DEFAULT_NOISE), rng=self._rng)
+        ]
+        if 'impulse_interval' in options:
+            generators.append(ImpulseGenerator(interval=options['impulse_interval'],
+                                               amplitude=options.get('impulse_amplitude', DEFAULT_AMPLITUDE * 10)))
+
+        self._generators.append(generators)
+        self._sensor_names.append(sensor_name)
+
+    def _read_raw(self) -> np.ndarray:
+        self._wait_next_block()
+        indices = np.arange(self._sample_idx, self._sample_idx + self._real_rate)
+        self._sample_idx += self._real_rate
+
+        buffer = np.zeros((len(self._generators), self._real_rate), dtype=np.float64)
+        for channel, generators in zip(buffer, self._generators):
+            for generator in generators:
+                channel += generator.generate(indices, self._real_rate)
+        return buffer
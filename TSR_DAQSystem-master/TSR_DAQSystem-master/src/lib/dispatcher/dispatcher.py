@@ -0,0 +1,105 @@
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum, auto
+from typing import Callable, Awaitable, Deque, Tuple, Optional
+
+
+class OverflowPolicy(Enum):
+    BLOCK       : int = auto()      # 자리가 날 때까지 생산자를 대기시킴
+    DROP_OLDEST : int = auto()      # 가장 오래된 항목을 버림
+    COALESCE    : int = auto()      # 합칠 수 있는 가장 최근 항목과 합침, 합칠 항목이 없으면 BLOCK 과 같이 대기함
+
+
+@dataclass
+class DispatchStats:
+    DEPTH       : int = 0
+    MAXSIZE     : int = 0
+    HANDLED     : int = 0
+    DROPPED     : int = 0
+    COALESCED   : int = 0
+
+
+class Dispatcher:
+    """
+        소비자 하나에 대한 bounded queue 와 전용 소비 태스크
+        느린 소비자가 있어도 대기 항목이 maxsize 를 넘지 않으며, 넘칠 때의 동작은 policy 로 정함
+        소비 태스크와 대기열은 loop 에서만 다루므로 다른 스레드에서는 loop.call_soon_threadsafe 로 생성, 종료해야 함
+
+        coalesce : (기존 항목, 새 항목) -> 합친 항목, 합칠 수 없으면 None
+    """
+    def __init__(self,
+                 loop: asyncio.AbstractEventLoop,
+                 name: str,
+                 callback: Callable[..., Awaitable],
+                 maxsize: int,
+                 policy: OverflowPolicy = OverflowPolicy.BLOCK,
+                 coalesce: Callable[[Tuple, Tuple], Optional[Tuple]] = None):
+        self._name = name
+        self._callback = callback
+        self._maxsize = maxsize
+        self._policy = policy
+        self._coalesce = coalesce
+
+        self._items: Deque[Tuple] = deque()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._stats = DispatchStats(MAXSIZE=maxsize)
+
+        self._task = loop.create_task(self._consume())
+
+    async def put(self, *args) -> None:
+        if len(self._items) >= self._maxsize:
+            if self._policy is OverflowPolicy.COALESCE and self._coalesce is not None and self._merge(args):
+                return
+            if self._policy is OverflowPolicy.DROP_OLDEST:
+                self._drop_oldest()
+            else:
+                # COALESCE 에서 합칠 항목이 없는 경우에도 항목을 버리지 않고 자리가 날 때까지 대기함
+                while len(self._items) >= self._maxsize:
+                    self._not_full.clear()
+                    await self._not_full.wait()
+
+        self._items.append(args)
+        self._not_empty.set()
+
+    def _merge(self, args: Tuple) -> bool:
+        # 마지막 항목만 보면 종류가 다른 항목이 섞여 있을 때 합치지 못하므로, 합칠 수 있는 가장 최근 항목을 뒤에서부터 찾음
+        for idx in range(len(self._items) - 1, -1, -1):
+            merged = self._coalesce(self._items[idx], args)
+            if merged is not None:
+                self._items[idx] = merged
+                self._stats.COALESCED += 1
+                return True
+        return False
+
+    def _drop_oldest(self) -> None:
+        self._items.popleft()
+        self._stats.DROPPED += 1
+
+    async def _consume(self) -> None:
+        while True:
+            while not self._items:
+                self._not_empty.clear()
+                await self._not_empty.wait()
+
+            args = self._items.popleft()
+            self._not_full.set()
+            try:
+                await self._callback(*args)
+            except Exception as err:
+                print(f'{self._name} Handling Error : \n{str(err)}')
+            self._stats.HANDLED += 1
+
+    def stats(self) -> DispatchStats:
+        return DispatchStats(DEPTH=len(self._items),
+                             MAXSIZE=self._maxsize,
+                             HANDLED=self._stats.HANDLED,
+                             DROPPED=self._stats.DROPPED,
+                             COALESCED=self._stats.COALESCED)
+
+    def close(self) -> None:
+        self._task.cancel()
+        self._items.clear()
+        self._not_full.set()
@@ -1,2 +1,12 @@
-from .lstm_ae import LstmAE
 from .model_config import ModelConfig
+from .normalizer import Normalizer
+from .inference_engine import InferenceEngine
+from .numpy_lstm_ae import NumpyLstmAE
+from .model_loader import load_model_configs, save_model_configs, load_model, load_models
+from .model_registry import ModelRegistry
+from .prefilter import PreFilter, batch_features, fit_bands, bands_from_features, load_prefilter, save_prefilter
+from .window_dataset import WindowDataset, RunningStats, read_data_chunks
+from .trainer import TrainConfig, TrainReport, fit_normalizer, train_model
+
+# keras 모델 LstmAE 는 TensorFlow 를 불러오므로 여기서 import 하지 않음
+# 필요한 곳에서만 lib.lstm_ae.lstm_ae 에서 직접 import 함
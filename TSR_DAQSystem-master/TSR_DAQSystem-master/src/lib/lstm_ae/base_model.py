@@ -3,6 +3,8 @@ import numpy as np
 from keras.models import Model
 from keras.layers import LSTM, RepeatVector, TimeDistributed, Dense
 
+from .windows import data_to_input
+
 
 class Encoder(Model):
     def __init__(self, seq_length: int, latent_dim: int):
@@ -53,15 +55,8 @@ class BaseModel(Model):
 
         return decoded
 
-    def _data_to_input(self, data: list) -> object:
-        # LSTM의 입력 데이터로 변환하는 메소드
-        # (입력 데이터 수, 시퀀스 길이, 사용할 컬럼 수)의 형태가 되어야 함
-        data_list = []
-
-        for i in range(len(data) - self.seq_len):
-            data_list.append(data[i:(i + self.seq_len)])
-
-        return np.array(data_list)
+    def _data_to_input(self, data: np.ndarray, stride: int = 1) -> np.ndarray:
+        return data_to_input(data, self.seq_len, stride)
 
     def load(self, model_path: str) -> None:
         self.build((None, self.seq_len, self.input_dim))
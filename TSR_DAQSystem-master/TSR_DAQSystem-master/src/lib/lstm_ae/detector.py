@@ -0,0 +1,72 @@
+import numpy as np
+from abc import ABC, abstractmethod
+from typing import List, Tuple, Union
+
+from .normalizer import Normalizer, standardize
+
+
+class Detector(ABC):
+    """
+        LstmAE 계열 모델의 고장 감지 로직
+        seq_len, window_stride, threshold, normalizer 와 _data_to_input, _forward 를 가진 모델에 섞어서 사용함
+        normalizer 가 없으면 (학습 통계가 없는 기존 모델) 배치별 표준화로 대신함
+    """
+    seq_len: int
+    window_stride: int
+    threshold: float
+    normalizer: Normalizer = None
+
+    @abstractmethod
+    def _data_to_input(self, data: np.ndarray, stride: int = 1) -> np.ndarray:
+        pass
+
+    @abstractmethod
+    def _forward(self, inputs: np.ndarray) -> np.ndarray:
+        # (윈도우 수, seq_len, input_dim) 입력의 복원 결과를 같은 형태의 ndarray 로 반환함
+        pass
+
+    def compile_inference(self) -> None:
+        # 고정된 입력 형태로 추론 함수를 미리 준비함, 필요 없는 엔진은 아무것도 하지 않음
+        pass
+
+    def warm_up(self, windows: int) -> None:
+        # 첫 배치에서 그래프 생성 / 메모리 할당이 일어나지 않도록 같은 크기의 입력으로 한 번 실행함
+        self._forward(np.zeros((max(windows, 1), self.seq_len, 1), dtype=np.float32))
+
+    def _normalize(self, data: np.ndarray) -> np.ndarray:
+        if self.normalizer is not None:
+            return self.normalizer(np.asarray(data, dtype=np.float64))
+        return standardize(data)
+
+    def score(self, batch: np.ndarray, normalized: bool = False) -> np.ndarray:
+        # 배치의 윈도우별 복원 오차 (MAE) 를 반환함
+        return self._window_mae(self._to_input(batch, normalized))
+
+    def detect(self, target: np.ndarray, return_mae: bool = False) -> Union[int, Tuple[int, np.ndarray]]:
+        # threshold 를 넘는 윈도우 수를 반환함, return_mae 이면 윈도우별 MAE 도 함께 반환함
+        # target 은 1차원 배열 또는 컬럼 하나짜리 2차원 배열 (DataFrame 도 가능)
+        target_mae = self.score(target)
+        count = int(np.count_nonzero(target_mae > self.threshold))
+        return (count, target_mae) if return_mae else count
+
+    def detect_batches(self, batches: List[np.ndarray], normalized: bool = False) -> List[int]:
+        # 배치별 결과는 detect 와 같음, normalized 이면 이미 normalizer 가 적용된 배치로 봄
+        return [int(np.count_nonzero(mae > self.threshold)) for mae in self.score_batches(batches, normalized)]
+
+    def score_batches(self, batches: List[np.ndarray], normalized: bool = False) -> List[np.ndarray]:
+        # 여러 배치를 배치별로 정규화한 뒤 윈도우를 이어붙여 한 번의 forward pass 로 윈도우별 MAE 를 계산함
+        inputs = [self._to_input(batch, normalized) for batch in batches]
+        counts = [len(target_input) for target_input in inputs]
+        if not sum(counts):
+            return [np.empty(0) for _ in batches]
+        return np.split(self._window_mae(np.concatenate(inputs)), np.cumsum(counts)[:-1])
+
+    def _to_input(self, batch: np.ndarray, normalized: bool) -> np.ndarray:
+        data = np.reshape(np.asarray(batch), (-1, 1))
+        return self._data_to_input(data if normalized else self._normalize(data), self.window_stride)
+
+    def _window_mae(self, inputs: np.ndarray) -> np.ndarray:
+        if not len(inputs):
+            return np.empty(0)
+        predict = self._forward(inputs)
+        return np.abs(predict - inputs).mean(axis=(1, 2))
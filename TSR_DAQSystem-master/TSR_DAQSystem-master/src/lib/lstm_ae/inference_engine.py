@@ -0,0 +1,6 @@
+from enum import Enum, auto
+
+
+class InferenceEngine(Enum):
+    NUMPY   : int = auto()      # NumpyLstmAE, TensorFlow 없이 동작함
+    KERAS   : int = auto()      # LstmAE (keras)
@@ -1,38 +1,35 @@
-
-import pandas as pd
 import numpy as np
 
-from pandas import DataFrame
-from sklearn.preprocessing import StandardScaler
-
 from .base_model import BaseModel
+from .detector import Detector
+from .normalizer import Normalizer
 
 
-class LstmAE(BaseModel):
+class LstmAE(BaseModel, Detector):
     def __init__(self,
                  seq_len: int,
                  input_dim: int,
                  latent_dim: int,
                  batch_size: int,
-                 threshold: float):
+                 threshold: float,
+                 window_stride: int = 1,
+                 normalizer: Normalizer = None):
         super(LstmAE, self).__init__(seq_len=seq_len,
                                      input_dim=input_dim,
                                      latent_dim=latent_dim)
         self.batch_size = batch_size
         self.threshold = threshold
-
-        self.scaler = StandardScaler()
-
-    def detect(self, target: DataFrame) -> int:
-        target_input = self._data_to_input(self.scaler.fit_transform(target))
-        target_predict = self.__call__(target_input)
-        target_mae = np.mean(np.abs(target_predict - target_input), axis=1)
-
-        anomaly_df = pd.DataFrame(target[self.seq_len:])
-        anomaly_df['target_mae'] = target_mae
-        anomaly_df['threshold'] = self.threshold
-        anomaly_df['anomaly'] = anomaly_df['target_mae'] > anomaly_df['threshold']
-        anomaly_df['data'] = target[self.seq_len:]['data']
-        anomalies = anomaly_df.loc[anomaly_df['anomaly'] == True]
-
-        return len(anomalies)
+        self.window_stride = window_stride
+        self.normalizer = normalizer
+        self._inference_fn = None
+
+    def compile_inference(self) -> None:
+        # 입력 형태를 (None, seq_len, input_dim) float32 로 고정해 그래프를 한 번만 만들도록 함
+        import tensorflow as tf
+        self._inference_fn = tf.function(self.call,
+                                         input_signature=[tf.TensorSpec((None, self.seq_len, self.input_dim), tf.float32)])
+
+    def _forward(self, inputs: np.ndarray) -> np.ndarray:
+        if self._inference_fn is None:
+            return np.asarray(self.__call__(inputs))
+        return self._inference_fn(np.asarray(inputs, dtype=np.float32)).numpy()
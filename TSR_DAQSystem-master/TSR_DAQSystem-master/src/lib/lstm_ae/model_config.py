@@ -1,4 +1,7 @@
 from dataclasses import dataclass
+from typing import Optional
+
+from .normalizer import Normalizer
 
 
 @dataclass
@@ -8,3 +11,11 @@ class ModelConfig:
     LATENT_DIM      : int
     SEQ_LEN         : int
     THRESHOLD       : int
+    WINDOW_STRIDE   : int = 1       # 배치에서 윈도우를 몇 샘플 간격으로 만들지, 키우면 점수 밀도 대신 연산량이 줄어듦
+    MEAN            : float = None  # 학습 데이터 평균, MEAN / STD 가 없으면 배치마다 표준화함
+    STD             : float = None  # 학습 데이터 표준편차
+
+    def normalizer(self) -> Optional[Normalizer]:
+        if self.MEAN is None or self.STD is None:
+            return None
+        return Normalizer(self.MEAN, self.STD)
@@ -0,0 +1,46 @@
+import os
+import yaml
+from dataclasses import asdict
+from typing import Dict, List
+
+from .model_config import ModelConfig
+from .inference_engine import InferenceEngine
+from .numpy_lstm_ae import NumpyLstmAE
+
+METADATA_FILE: str = 'METADATA.yml'
+
+
+def load_model_configs(model_dir: str) -> List[ModelConfig]:
+    with open(os.path.join(model_dir, METADATA_FILE), 'r', encoding='UTF-8') as yml:
+        cfg = yaml.safe_load(yml)
+    return [ModelConfig(**parm) for parm in cfg['MODELS']]
+
+
+def save_model_configs(model_dir: str, confs: List[ModelConfig]) -> None:
+    # load_model_configs 가 읽는 형식으로 저장함, 값이 없는 선택 항목은 생략함
+    models = [{key: value for key, value in asdict(conf).items() if value is not None} for conf in confs]
+    with open(os.path.join(model_dir, METADATA_FILE), 'w', encoding='UTF-8') as yml:
+        yaml.safe_dump({'MODELS': models}, yml, sort_keys=False)
+
+
+def load_model(model_dir: str, conf: ModelConfig, engine: InferenceEngine = InferenceEngine.NUMPY):
+    if engine is InferenceEngine.KERAS:
+        # keras 는 필요한 경우에만 import 함
+        from .lstm_ae import LstmAE
+        model_class = LstmAE
+    else:
+        model_class = NumpyLstmAE
+
+    model = model_class(seq_len=conf.SEQ_LEN,
+                        input_dim=1,
+                        latent_dim=conf.LATENT_DIM,
+                        batch_size=conf.BATCH_SIZE,
+                        threshold=conf.THRESHOLD,
+                        window_stride=conf.WINDOW_STRIDE,
+                        normalizer=conf.normalizer())
+    model.load(os.path.join(model_dir, f'{conf.NAME}.h5'))
+    return model
+
+
+def load_models(model_dir: str, engine: InferenceEngine = InferenceEngine.NUMPY) -> Dict:
+    return {conf.NAME: load_model(model_dir, conf, engine) for conf in load_model_configs(model_dir)}
@@ -0,0 +1,53 @@
+import os
+import time
+import threading
+from dataclasses import astuple
+from typing import Dict, Tuple
+
+from .model_config import ModelConfig
+from .inference_engine import InferenceEngine
+from .model_loader import load_model, load_model_configs
+
+
+class ModelRegistry:
+    """
+        프로세스 전역 모델 저장소, (모델 파일 경로, 설정) 마다 모델을 한 번만 로드함
+        로드 시 고정 입력 형태의 추론 함수를 준비하고 배치 크기로 warm-up 하여 첫 배치 지연을 없앰
+        여러 Machine 이 같은 모델 파일을 사용해도 메모리는 모델 수만큼만 사용함
+    """
+    def __init__(self, engine: InferenceEngine = InferenceEngine.NUMPY):
+        self._engine = engine
+        # load_dir 가 lock 을 잡은 채로 get 을 호출하므로 재진입 가능한 lock 을 사용함
+        self._lock = threading.RLock()
+        self._models: Dict[Tuple, object] = {}
+        self._dirs: Dict[str, Dict[str, object]] = {}
+
+    def get(self, model_dir: str, conf: ModelConfig):
+        path = os.path.realpath(os.path.join(model_dir, f'{conf.NAME}.h5'))
+        key = (path, astuple(conf))
+        with self._lock:
+            if key not in self._models:
+                self._models[key] = self._load(model_dir, conf, path)
+            return self._models[key]
+
+    def load_dir(self, model_dir: str) -> Dict[str, object]:
+        # model_dir 의 METADATA 에 있는 모델을 {모델 이름 -> 모델} 로 반환함
+        with self._lock:
+            if model_dir not in self._dirs:
+                self._dirs[model_dir] = {conf.NAME: self.get(model_dir, conf) for conf in load_model_configs(model_dir)}
+            return self._dirs[model_dir]
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def _load(self, model_dir: str, conf: ModelConfig, path: str):
+        begin = time.perf_counter()
+        model = load_model(model_dir, conf, self._engine)
+        loaded = time.perf_counter()
+        model.compile_inference()
+        # data_to_input 과 같이 len(data) - seq_len 개의 시작 위치를 stride 간격으로 쓰므로 윈도우 수는 올림임
+        model.warm_up(-(-(conf.BATCH_SIZE - conf.SEQ_LEN) // max(conf.WINDOW_STRIDE, 1)))
+        warmed = time.perf_counter()
+        print(f'Model Loaded ({self._engine.name}) : {path} - load {loaded - begin:.2f} sec, '
+              f'warm-up {warmed - loaded:.2f} sec')
+        return model
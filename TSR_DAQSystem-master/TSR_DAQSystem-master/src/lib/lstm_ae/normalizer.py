@@ -0,0 +1,26 @@
+import numpy as np
+
+
+class Normalizer:
+    """
+        학습 시점의 평균 / 표준편차로 고정된 정규화
+        배치마다 다시 맞추지 않으므로 진폭 변화가 모델 입력에 그대로 드러남
+        블록이 들어올 때마다 버퍼에 바로 적용할 수 있도록 out 을 지원함
+    """
+    def __init__(self, mean: float, std: float):
+        self.mean = mean
+        self.scale = 1.0 / std if std else 1.0
+
+    def __call__(self, data: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        out = np.subtract(data, self.mean, out=out, casting='same_kind')
+        out *= self.scale
+        return out
+
+
+def standardize(data: np.ndarray) -> np.ndarray:
+    # 학습 통계가 없는 모델용, sklearn StandardScaler().fit_transform 과 같은 배치별 표준화 (분산이 0 이면 평균만 뺌)
+    data = np.asarray(data, dtype=np.float64)
+    mean = data.mean(axis=0)
+    std = data.std(axis=0)
+    std[std < 10 * np.finfo(std.dtype).eps] = 1.0
+    return (data - mean) / std
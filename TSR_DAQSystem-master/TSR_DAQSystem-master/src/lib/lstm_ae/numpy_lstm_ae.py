@@ -0,0 +1,127 @@
+import numpy as np
+from typing import List
+
+from .detector import Detector
+from .normalizer import Normalizer
+from .windows import data_to_input
+
+
+class NumpyLSTM:
+    """
+        keras LSTM 층의 추론 전용 구현 (activation=tanh, recurrent_activation=sigmoid)
+        keras 가중치의 게이트 순서 i, f, c, o 를 로드 시 i, f, o, c 로 바꿔 sigmoid 게이트를 한 번에 계산함
+        입출력은 시간 축이 앞에 오는 (T, N, D) 형태를 사용해 시점별 슬라이스가 연속된 메모리가 되도록 함
+    """
+    def __init__(self, kernel: np.ndarray, recurrent_kernel: np.ndarray, bias: np.ndarray, return_sequences: bool):
+        self.units = recurrent_kernel.shape[0]
+        order = np.concatenate([np.arange(0, 2 * self.units),
+                                np.arange(3 * self.units, 4 * self.units),
+                                np.arange(2 * self.units, 3 * self.units)])
+        # sigmoid(x) = 0.5 * tanh(0.5 * x) + 0.5 로 계산하므로 sigmoid 게이트 가중치에 0.5 를 미리 곱해둠
+        scale = np.ones(4 * self.units, dtype=kernel.dtype)
+        scale[:3 * self.units] = 0.5
+        self.kernel = np.ascontiguousarray(kernel[:, order] * scale)
+        self.recurrent_kernel = np.ascontiguousarray(recurrent_kernel[:, order] * scale)
+        self.bias = np.ascontiguousarray(bias[order] * scale)
+        self.return_sequences = return_sequences
+
+    def __call__(self, inputs: np.ndarray, repeat: int = None) -> np.ndarray:
+        # inputs : (T, N, D), repeat 가 주어지면 (N, D) 입력을 repeat 번 반복한 것으로 봄 (RepeatVector)
+        # 입력 투영은 모든 시점에 대해 한 번의 행렬곱으로 미리 계산함
+        projected = inputs @ self.kernel + self.bias
+        steps = repeat if repeat is not None else inputs.shape[0]
+        batch = inputs.shape[-2]
+        units = self.units
+
+        h = np.zeros((batch, units), dtype=self.kernel.dtype)
+        c = np.zeros_like(h)
+        z = np.empty((batch, 4 * units), dtype=h.dtype)
+        outputs = np.empty((steps, batch, units), dtype=h.dtype) if self.return_sequences else None
+        for t in range(steps):
+            np.matmul(h, self.recurrent_kernel, out=z)
+            z += projected if repeat is not None else projected[t]
+
+            # sigmoid 게이트 i, f, o (입력은 이미 0.5 배 되어 있음), scipy expit 보다 빠름
+            gates = z[:, :3 * units]
+            np.tanh(gates, out=gates)
+            gates *= 0.5
+            gates += 0.5
+            candidate = np.tanh(z[:, 3 * units:])
+
+            c *= z[:, units:2 * units]
+            candidate *= z[:, :units]
+            c += candidate
+            h = np.tanh(c)
+            h *= z[:, 2 * units:3 * units]
+            if outputs is not None:
+                outputs[t] = h
+
+        return outputs if outputs is not None else h
+
+
+class NumpyLstmAE(Detector):
+    """
+        TensorFlow 없이 NumPy 만으로 LstmAE 의 forward pass 를 수행하는 추론 전용 모델
+        LstmAE.save_weights 로 저장된 .h5 가중치를 그대로 읽으며, 기본은 float32 로 계산함
+    """
+    def __init__(self,
+                 seq_len: int,
+                 input_dim: int,
+                 latent_dim: int,
+                 batch_size: int,
+                 threshold: float,
+                 window_stride: int = 1,
+                 normalizer: Normalizer = None,
+                 dtype: type = np.float32):
+        self.seq_len = seq_len
+        self.input_dim = input_dim
+        self.latent_dim = latent_dim
+        self.batch_size = batch_size
+        self.threshold = threshold
+        self.window_stride = window_stride
+        self.normalizer = normalizer
+        self.dtype = dtype
+
+        self._encoder: List[NumpyLSTM] = []
+        self._decoder: List[NumpyLSTM] = []
+        self._dense_kernel: np.ndarray = None
+        self._dense_bias: np.ndarray = None
+
+    def load(self, model_path: str) -> None:
+        import h5py
+
+        # keras h5 : 루트 layer_names = [encoder, decoder], 각 그룹의 weight_names 는 층 순서대로 저장됨
+        with h5py.File(model_path, 'r') as f:
+            groups = [_decode(name) for name in f.attrs['layer_names']]
+            weights = [[np.asarray(f[group][_decode(name)], dtype=self.dtype)
+                        for name in f[group].attrs['weight_names']]
+                       for group in groups]
+
+        if len(weights) != 2 or len(weights[0]) != 6 or len(weights[1]) != 8:
+            raise RuntimeError(f'{model_path} : unexpected LstmAE weight layout')
+        encoder, decoder = weights
+        self._encoder = [NumpyLSTM(*encoder[0:3], return_sequences=True),
+                         NumpyLSTM(*encoder[3:6], return_sequences=False)]
+        self._decoder = [NumpyLSTM(*decoder[0:3], return_sequences=True),
+                         NumpyLSTM(*decoder[3:6], return_sequences=True)]
+        self._dense_kernel, self._dense_bias = decoder[6:8]
+
+    def __call__(self, inputs: np.ndarray) -> np.ndarray:
+        return self._forward(inputs)
+
+    def _data_to_input(self, data: np.ndarray, stride: int = 1) -> np.ndarray:
+        return data_to_input(data, self.seq_len, stride)
+
+    def _forward(self, inputs: np.ndarray) -> np.ndarray:
+        x = np.asarray(inputs, dtype=self.dtype).transpose(1, 0, 2)        # (T, N, D)
+        steps = x.shape[0]
+
+        x = self._encoder[0](x)
+        z = self._encoder[1](x)
+        x = self._decoder[0](z, repeat=steps)
+        x = self._decoder[1](x)
+        return (x @ self._dense_kernel + self._dense_bias).transpose(1, 0, 2)
+
+
+def _decode(name) -> str:
+    return name.decode('utf-8') if isinstance(name, bytes) else name
@@ -0,0 +1,89 @@
+import os
+import yaml
+import numpy as np
+from typing import Dict, Optional, Sequence
+
+PREFILTER_FILE: str = 'PREFILTER.yml'
+FEATURES = ('RMS', 'PEAK', 'CREST', 'KURTOSIS')
+AUDIT_INTERVAL: int = 20
+BAND_MARGIN: float = 0.1
+
+
+def batch_features(batch: np.ndarray) -> np.ndarray:
+    # 마지막 축 기준 (RMS, PEAK, CREST, KURTOSIS), 2차원 입력이면 행마다 계산함
+    x = np.asarray(batch, dtype=np.float64)
+    centered = x - x.mean(axis=-1, keepdims=True)
+    var = np.mean(centered ** 2, axis=-1)
+    rms = np.sqrt(np.mean(x ** 2, axis=-1))
+    peak = np.max(np.abs(x), axis=-1)
+    crest = np.divide(peak, rms, out=np.zeros_like(rms), where=rms > 0)
+    kurtosis = np.divide(np.mean(centered ** 4, axis=-1), var ** 2, out=np.zeros_like(var), where=var > 0)
+    return np.stack([rms, peak, crest, kurtosis], axis=-1)
+
+
+def fit_bands(batches: Sequence[np.ndarray], margin: float = BAND_MARGIN) -> np.ndarray:
+    # 정상 배치들의 특징 범위를 margin 비율만큼 넓혀 (특징 수, 2) 의 [하한, 상한] 으로 반환함
+    return bands_from_features(np.array([batch_features(batch) for batch in batches]), margin)
+
+
+def bands_from_features(features: np.ndarray, margin: float = BAND_MARGIN) -> np.ndarray:
+    # 배치별 특징 (배치 수, 특징 수) 로 범위를 계산함, 배치를 모두 메모리에 둘 수 없을 때 특징만 모아서 사용함
+    low, high = features.min(axis=0), features.max(axis=0)
+    pad = (high - low) * margin
+    return np.stack([low - pad, high + pad], axis=-1)
+
+
+class PreFilter:
+    """
+        LSTM 추론 전에 배치 통계로 명백한 정상 배치를 걸러내는 필터
+        모든 센서의 특징이 학습된 정상 범위 안에 있으면 추론을 생략하며,
+        필터를 검증할 수 있도록 audit_interval 번째 정상 배치마다 추론을 그대로 수행함
+        범위는 모델 입력과 같은 값 (MEAN / STD 가 있으면 정규화된 값) 기준으로 학습되어야 함
+    """
+    def __init__(self, bands: Dict[str, np.ndarray], audit_interval: int = AUDIT_INTERVAL):
+        self._bands = bands
+        self._audit_interval = audit_interval
+        self._normal_count: int = 0
+
+    def bands(self) -> Dict[str, np.ndarray]:
+        return dict(self._bands)
+
+    def audit_interval(self) -> int:
+        return self._audit_interval
+
+    def is_normal(self, batches: Dict[str, np.ndarray]) -> bool:
+        for name, batch in batches.items():
+            bands = self._bands.get(name)
+            if bands is None:
+                return False
+            features = batch_features(batch)
+            if np.any(features < bands[:, 0]) or np.any(features > bands[:, 1]):
+                return False
+        return True
+
+    def should_audit(self) -> bool:
+        # 정상으로 판단된 배치 중 audit_interval 번째마다 True
+        self._normal_count += 1
+        return self._audit_interval > 0 and self._normal_count % self._audit_interval == 0
+
+
+def load_prefilter(model_dir: str) -> Optional[PreFilter]:
+    # model_dir 에 PREFILTER.yml 이 없으면 필터를 사용하지 않음
+    path = os.path.join(model_dir, PREFILTER_FILE)
+    if not os.path.isfile(path):
+        return None
+    with open(path, 'r', encoding='UTF-8') as yml:
+        cfg = yaml.safe_load(yml)
+    bands = {name: np.array([sensor_bands[feature] for feature in FEATURES], dtype=np.float64)
+             for name, sensor_bands in cfg['BANDS'].items()}
+    return PreFilter(bands, cfg.get('AUDIT_INTERVAL', AUDIT_INTERVAL))
+
+
+def save_prefilter(model_dir: str, bands: Dict[str, np.ndarray], audit_interval: int = AUDIT_INTERVAL) -> None:
+    cfg = {
+        'AUDIT_INTERVAL': audit_interval,
+        'BANDS': {name: {feature: [float(low), float(high)] for feature, (low, high) in zip(FEATURES, sensor_bands)}
+                  for name, sensor_bands in bands.items()}
+    }
+    with open(os.path.join(model_dir, PREFILTER_FILE), 'w', encoding='UTF-8') as yml:
+        yaml.safe_dump(cfg, yml, sort_keys=False)
@@ -0,0 +1,149 @@
+import os
+import sys
+import time
+import numpy as np
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from .model_config import ModelConfig
+from .normalizer import Normalizer
+from .prefilter import batch_features, bands_from_features
+from .window_dataset import WindowDataset, RunningStats, read_data_chunks, CHUNK_SAMPLES, HOLDOUT_EVERY
+
+THRESHOLD_PERCENTILE: float = 99.9      # 검증 데이터 윈도우 MAE 의 몇 퍼센타일을 THRESHOLD 로 쓸지
+SCORE_BATCHES: int = 32                 # 검증 데이터를 한 번에 채점할 배치 수
+
+
+@dataclass
+class TrainConfig:
+    SEQ_LEN             : int = 30
+    LATENT_DIM          : int = 16
+    BATCH_SIZE          : int = 1000
+    WINDOW_STRIDE       : int = 1
+    EPOCHS              : int = 10
+    PERCENTILE          : float = THRESHOLD_PERCENTILE
+    HOLDOUT_EVERY       : int = HOLDOUT_EVERY
+    CHUNK_SAMPLES       : int = CHUNK_SAMPLES
+
+
+@dataclass
+class TrainReport:
+    NAME                : str
+    TRAIN_WINDOWS       : int = 0
+    HOLDOUT_WINDOWS     : int = 0
+    THRESHOLD           : float = 0.0
+    TRAIN_TIME          : float = 0.0   # sec
+    TOTAL_TIME          : float = 0.0   # 통계 계산, 학습, 임계값 계산을 모두 포함 (sec)
+    PEAK_MEMORY         : int = 0       # 학습을 마친 시점까지의 프로세스 최대 RSS (bytes), TensorFlow 할당 포함, 측정할 수 없으면 0
+
+
+def peak_rss() -> int:
+    # 프로세스 최대 RSS (bytes), 프로세스 전체 기준이므로 여러 센서를 학습하면 누적 최대값임
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux 는 KiB, macOS 는 bytes 단위임
+        return peak if sys.platform == 'darwin' else peak * 1024
+    except ImportError:
+        pass
+    # Windows 에는 resource 모듈이 없으므로 psutil 이 있으면 최대 working set 을 사용함
+    try:
+        import psutil
+        return getattr(psutil.Process().memory_info(), 'peak_wset', 0)
+    except ImportError:
+        return 0
+
+
+def fit_normalizer(paths: List[str], chunk_samples: int = CHUNK_SAMPLES) -> Normalizer:
+    stats = RunningStats()
+    for path in paths:
+        for chunk in read_data_chunks(path, chunk_samples):
+            stats.update(chunk)
+    return Normalizer(stats.mean, stats.std)
+
+
+def train_model(model_dir: str, name: str, paths: List[str], t_conf: TrainConfig) -> Tuple[ModelConfig, np.ndarray, TrainReport]:
+    """
+        센서 하나의 일별 CSV 들로 LstmAE 를 학습하고 model_dir/{name}.h5 에 저장함
+        THRESHOLD 는 검증 배치 윈도우 MAE 의 PERCENTILE 퍼센타일, 사전 필터 범위는 검증 배치의 특징 범위로 정함
+        (ModelConfig, 사전 필터 범위, TrainReport) 를 반환함
+    """
+    import tensorflow as tf
+    from .lstm_ae import LstmAE
+
+    report = TrainReport(NAME=name)
+    begin = time.perf_counter()
+    try:
+        normalizer = fit_normalizer(paths, t_conf.CHUNK_SAMPLES)
+        dataset = WindowDataset(paths=paths,
+                                seq_len=t_conf.SEQ_LEN,
+                                batch_size=t_conf.BATCH_SIZE,
+                                normalizer=normalizer,
+                                window_stride=t_conf.WINDOW_STRIDE,
+                                holdout_every=t_conf.HOLDOUT_EVERY,
+                                chunk_samples=t_conf.CHUNK_SAMPLES)
+        model = LstmAE(seq_len=t_conf.SEQ_LEN,
+                       input_dim=1,
+                       latent_dim=t_conf.LATENT_DIM,
+                       batch_size=t_conf.BATCH_SIZE,
+                       threshold=0.0,
+                       window_stride=t_conf.WINDOW_STRIDE,
+                       normalizer=normalizer)
+        model.compile(optimizer='adam', loss='mae')
+
+        def train_windows():
+            # 학습 윈도우 수를 별도로 세기 위해 파일을 한 번 더 읽지 않도록 학습 중에 셈
+            for inputs, targets in dataset.windows(holdout=False):
+                report.TRAIN_WINDOWS += len(inputs)
+                yield inputs, targets
+
+        spec = tf.TensorSpec((None, t_conf.SEQ_LEN, 1), tf.float32)
+        train_data = tf.data.Dataset.from_generator(train_windows, output_signature=(spec, spec)).prefetch(2)
+        trained = time.perf_counter()
+        model.fit(train_data, epochs=t_conf.EPOCHS, verbose=2)
+        report.TRAIN_TIME = time.perf_counter() - trained
+        report.TRAIN_WINDOWS //= max(t_conf.EPOCHS, 1)
+
+        maes, features = _score_holdout(model, dataset)
+        if not len(maes):
+            raise ValueError(f'{name} : no holdout data')
+        report.HOLDOUT_WINDOWS = len(maes)
+        report.THRESHOLD = float(np.percentile(maes, t_conf.PERCENTILE))
+        bands = bands_from_features(features)
+
+        model.save_weights(os.path.join(model_dir, f'{name}.h5'))
+    finally:
+        report.TOTAL_TIME = time.perf_counter() - begin
+        report.PEAK_MEMORY = peak_rss()
+
+    conf = ModelConfig(NAME=name,
+                       BATCH_SIZE=t_conf.BATCH_SIZE,
+                       LATENT_DIM=t_conf.LATENT_DIM,
+                       SEQ_LEN=t_conf.SEQ_LEN,
+                       THRESHOLD=report.THRESHOLD,
+                       WINDOW_STRIDE=t_conf.WINDOW_STRIDE,
+                       MEAN=normalizer.mean,
+                       STD=1.0 / normalizer.scale)
+    return conf, bands, report
+
+
+def _score_holdout(model, dataset: WindowDataset) -> Tuple[np.ndarray, np.ndarray]:
+    # 검증 배치를 SCORE_BATCHES 개씩 모아 한 번에 채점하고, 배치별 사전 필터 특징도 함께 계산함
+    maes: List[np.ndarray] = []
+    features: List[np.ndarray] = []
+    group: List[np.ndarray] = []
+    for batch in dataset.batches(holdout=True):
+        group.append(batch)
+        if len(group) == SCORE_BATCHES:
+            _score_group(model, group, maes, features)
+            group = []
+    if group:
+        _score_group(model, group, maes, features)
+    if not maes:
+        return np.empty(0, dtype=np.float32), np.empty((0, 4))
+    return np.concatenate(maes), np.concatenate(features)
+
+
+def _score_group(model, group: List[np.ndarray], maes: List[np.ndarray], features: List[np.ndarray]) -> None:
+    maes.extend(mae.astype(np.float32) for mae in model.score_batches(group, normalized=True))
+    features.append(batch_features(np.stack(group)))
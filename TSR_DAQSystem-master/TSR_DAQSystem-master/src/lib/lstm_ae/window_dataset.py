@@ -0,0 +1,86 @@
+import numpy as np
+from itertools import islice
+from typing import Iterator, List, Tuple
+
+from .normalizer import Normalizer
+from .windows import data_to_input
+
+CHUNK_SAMPLES: int = 1_000_000      # 파일에서 한 번에 읽을 샘플 수
+HOLDOUT_EVERY: int = 5              # 배치 몇 개마다 하나를 검증용으로 떼어둘지
+
+
+def read_data_chunks(path: str, chunk_samples: int = CHUNK_SAMPLES) -> Iterator[np.ndarray]:
+    # DataSaver 가 저장한 (time, data) CSV 의 data 컬럼을 chunk_samples 개씩 float32 로 읽음
+    with open(path, 'r', newline='') as file:
+        next(file, None)    # header
+        while True:
+            lines = list(islice(file, chunk_samples))
+            if not lines:
+                break
+            yield np.loadtxt(lines, delimiter=',', usecols=1, dtype=np.float32, ndmin=1)
+
+
+class RunningStats:
+    """ 전체 데이터를 메모리에 올리지 않고 chunk 단위로 평균 / 표준편차를 누적 계산함 (Chan 의 병합 공식) """
+    def __init__(self):
+        self.count: int = 0
+        self.mean: float = 0.0
+        self._m2: float = 0.0
+
+    def update(self, data: np.ndarray) -> None:
+        if not len(data):
+            return
+        data = np.asarray(data, dtype=np.float64)
+        count, mean = len(data), float(data.mean())
+        m2 = float(np.sum((data - mean) ** 2))
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self._m2 += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self._m2 / self.count)) if self.count else 0.0
+
+
+class WindowDataset:
+    """
+        일별 CSV 들을 Machine 과 같은 BATCH_SIZE 샘플 배치로 나눠 스트리밍하는 데이터셋
+        메모리에는 읽고 있는 chunk 하나만 유지하며, holdout_every 번째 배치마다 검증용으로 떼어둠
+        배치는 normalizer 를 적용한 float32 값이므로 모델에는 normalized=True 로 넘김
+    """
+    def __init__(self,
+                 paths: List[str],
+                 seq_len: int,
+                 batch_size: int,
+                 normalizer: Normalizer,
+                 window_stride: int = 1,
+                 holdout_every: int = HOLDOUT_EVERY,
+                 chunk_samples: int = CHUNK_SAMPLES):
+        self.paths = paths
+        self.seq_len = seq_len
+        self.batch_size = batch_size
+        self.normalizer = normalizer
+        self.window_stride = window_stride
+        self.holdout_every = holdout_every
+        self.chunk_samples = max(chunk_samples // batch_size, 1) * batch_size
+
+    def batches(self, holdout: bool = False) -> Iterator[np.ndarray]:
+        # 파일마다 배치 순번을 새로 세며, 파일 끝의 채워지지 않은 배치는 Machine 과 같이 버림
+        for path in self.paths:
+            index = 0
+            for chunk in read_data_chunks(path, self.chunk_samples):
+                n_batches = len(chunk) // self.batch_size
+                chunk = self.normalizer(chunk[:n_batches * self.batch_size], out=chunk[:n_batches * self.batch_size])
+                for batch in np.split(chunk, n_batches) if n_batches else []:
+                    if (index % self.holdout_every == self.holdout_every - 1) == holdout:
+                        yield batch
+                    index += 1
+
+    def windows(self, holdout: bool = False) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        # 배치 하나의 윈도우를 학습 step 하나로 사용함, 입력과 정답이 같은 (x, x) 를 반환함
+        for batch in self.batches(holdout):
+            inputs = np.ascontiguousarray(data_to_input(batch, self.seq_len, self.window_stride))
+            if len(inputs):
+                yield inputs, inputs
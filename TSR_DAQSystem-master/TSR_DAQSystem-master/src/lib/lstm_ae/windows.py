@@ -0,0 +1,16 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def data_to_input(data: np.ndarray, seq_len: int, stride: int = 1) -> np.ndarray:
+    # LSTM의 입력 데이터로 변환하는 함수
+    # (입력 데이터 수, 시퀀스 길이, 사용할 컬럼 수)의 형태가 되어야 함
+    # 복사 없이 strided view 로 만들며, 윈도우 수는 기존과 같이 len(data) - seq_len 개를 stride 간격으로 사용함
+    data = np.asarray(data)
+    if data.ndim == 1:
+        data = data[:, np.newaxis]
+    if len(data) <= seq_len:
+        return np.empty((0, seq_len, data.shape[1]), dtype=data.dtype)
+
+    windows = sliding_window_view(data, seq_len, axis=0)        # (n - seq_len + 1, columns, seq_len)
+    return windows[:len(data) - seq_len:stride].transpose(0, 2, 1)
@@ -0,0 +1,3 @@
+from .stage import Stage
+from .latency_histogram import LatencyHistogram, HistogramSnapshot
+from .metrics_registry import MetricsRegistry, get_registry
@@ -0,0 +1,89 @@
+import math
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import List
+
+MIN_LATENCY: float = 1e-5       # 10 us
+MAX_LATENCY: float = 1e3        # 1000 sec
+BUCKETS_PER_DECADE: int = 20
+
+
+@dataclass
+class HistogramSnapshot:
+    COUNT       : int = 0
+    MEAN        : float = 0.0       # sec
+    P50         : float = 0.0
+    P95         : float = 0.0
+    P99         : float = 0.0
+    MAX         : float = 0.0
+    SAMPLES     : int = 0           # 이 단계를 지난 샘플 수
+    THROUGHPUT  : float = 0.0       # samples / sec
+
+
+def _bucket_bounds() -> List[float]:
+    decades = math.log10(MAX_LATENCY / MIN_LATENCY)
+    count = int(decades * BUCKETS_PER_DECADE)
+    return [MIN_LATENCY * 10 ** (i / BUCKETS_PER_DECADE) for i in range(count + 1)]
+
+
+BUCKET_BOUNDS: List[float] = _bucket_bounds()
+
+
+class LatencyHistogram:
+    """
+        로그 간격 bucket 으로 지연 시간 분포를 누적하는 히스토그램
+        값을 모두 보관하지 않으므로 메모리가 일정하며, 백분위수는 bucket 상한으로 근사함 (오차 약 12%)
+        여러 스레드에서 기록할 수 있음
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: List[int] = [0] * (len(BUCKET_BOUNDS) + 1)
+        self._count: int = 0
+        self._sum: float = 0.0
+        self._max: float = 0.0
+        self._samples: int = 0
+
+    def record(self, seconds: float, samples: int = 0) -> None:
+        index = bisect_right(BUCKET_BOUNDS, seconds)
+        with self._lock:
+            self._buckets[index] += 1
+            self._count += 1
+            self._sum += seconds
+            self._max = max(self._max, seconds)
+            self._samples += samples
+
+    def snapshot(self, elapsed: float) -> HistogramSnapshot:
+        with self._lock:
+            buckets = list(self._buckets)
+            count, total, maximum, samples = self._count, self._sum, self._max, self._samples
+
+        if count == 0:
+            return HistogramSnapshot()
+        return HistogramSnapshot(COUNT=count,
+                                 MEAN=total / count,
+                                 P50=self._percentile(buckets, count, maximum, 0.50),
+                                 P95=self._percentile(buckets, count, maximum, 0.95),
+                                 P99=self._percentile(buckets, count, maximum, 0.99),
+                                 MAX=maximum,
+                                 SAMPLES=samples,
+                                 THROUGHPUT=samples / elapsed if elapsed > 0 else 0.0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+            self._count = 0
+            self._sum = 0.0
+            self._max = 0.0
+            self._samples = 0
+
+    @staticmethod
+    def _percentile(buckets: List[int], count: int, maximum: float, q: float) -> float:
+        rank = q * count
+        cumulative = 0
+        for index, bucket in enumerate(buckets):
+            cumulative += bucket
+            if cumulative >= rank:
+                bound = BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else maximum
+                return min(bound, maximum)
+        return maximum
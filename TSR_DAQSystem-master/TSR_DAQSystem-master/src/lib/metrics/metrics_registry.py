@@ -0,0 +1,65 @@
+import time
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+from .stage import Stage
+from .latency_histogram import LatencyHistogram, HistogramSnapshot
+
+
+class MetricsRegistry:
+    """
+        단계별 지연 시간 히스토그램과 처리량을 모아두는 저장소
+        수집 스레드, 이벤트 루프, GUI 스레드에서 모두 기록하므로 프로세스 전역 인스턴스를 get_registry() 로 공유함
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[Stage, LatencyHistogram] = {stage: LatencyHistogram() for stage in Stage}
+        self._started: float = time.monotonic()
+
+    def record(self, stage: Stage, seconds: float, samples: int = 0) -> None:
+        self._histograms[stage].record(seconds, samples)
+
+    def record_since(self, stage: Stage, acquired: float, samples: int = 0) -> None:
+        # acquired 는 time.monotonic() 기준 블록 수집 시각, 0 이면 기록하지 않음
+        if acquired:
+            self.record(stage, time.monotonic() - acquired, samples)
+
+    @contextmanager
+    def timer(self, stage: Stage, samples: int = 0) -> Iterator[None]:
+        begin = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(stage, time.monotonic() - begin, samples)
+
+    def snapshot(self) -> Dict[Stage, HistogramSnapshot]:
+        elapsed = time.monotonic() - self._started
+        return {stage: histogram.snapshot(elapsed) for stage, histogram in self._histograms.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            for histogram in self._histograms.values():
+                histogram.reset()
+            self._started = time.monotonic()
+
+    def format(self) -> str:
+        lines = [f'{"stage":<12}{"count":>10}{"mean(ms)":>12}{"p50(ms)":>12}{"p95(ms)":>12}'
+                 f'{"p99(ms)":>12}{"max(ms)":>12}{"samples/s":>14}']
+        for stage, snap in self.snapshot().items():
+            lines.append(f'{stage.name:<12}{snap.COUNT:>10}{snap.MEAN * 1e3:>12.2f}{snap.P50 * 1e3:>12.2f}'
+                         f'{snap.P95 * 1e3:>12.2f}{snap.P99 * 1e3:>12.2f}{snap.MAX * 1e3:>12.2f}'
+                         f'{snap.THROUGHPUT:>14.1f}')
+        return '\n'.join(lines)
+
+    def dump(self, path: str) -> None:
+        # 현재 통계를 시각과 함께 로그 파일 끝에 덧붙임
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(f'[{time.strftime("%Y-%m-%d %H:%M:%S")}]\n{self.format()}\n\n')
+
+
+_registry = MetricsRegistry()
+
+
+def get_registry() -> MetricsRegistry:
+    return _registry
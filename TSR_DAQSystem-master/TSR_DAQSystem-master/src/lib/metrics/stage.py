@@ -0,0 +1,16 @@
+from enum import Enum, auto
+
+
+class Stage(Enum):
+    # 처리 시간 (해당 단계에 걸린 시간)
+    READ            : int = auto()      # 장비 버퍼에서 블록 하나를 읽는 시간 (블록 대기 포함)
+    RESAMPLE        : int = auto()      # real_rate -> rate 변환 시간
+    INFERENCE       : int = auto()      # 배치 하나의 고장 감지 점수 계산 시간
+
+    # 지연 시간 (블록 수집 시각부터 해당 단계 도달까지)
+    DISPATCH        : int = auto()      # Machine 이 블록을 전달받은 시점
+    BATCH_FILL      : int = auto()      # 배치의 첫 샘플 수집부터 배치가 채워진 시점
+    DETECT_LAG      : int = auto()      # 배치가 채워진 뒤 고장 감지 점수가 나온 시점 (대기 시간 포함)
+    SEND            : int = auto()      # 서버 소켓에 쓴 시점
+    SAVE            : int = auto()      # CSV 에 쓴 시점
+    GUI_EMIT        : int = auto()      # 화면에 반영된 시점
@@ -0,0 +1 @@
+from .shared_ring_buffer import SharedRingBuffer, RingReader
@@ -0,0 +1,106 @@
+import re
+import numpy as np
+from multiprocessing import shared_memory
+from typing import Tuple
+
+HEADER_SIZE: int = 16      # int64 x 2 : (누적 기록 샘플 수, 용량)
+
+
+def shm_name(prefix: str, sensor: str) -> str:
+    return re.sub(r'[^0-9A-Za-z_]', '_', f'{prefix}_{sensor}')
+
+
+class SharedRingBuffer:
+    """
+        multiprocessing.shared_memory 위의 센서별 float64 ring buffer
+        기록자는 하나(DAQ)이며, 소비자는 다른 프로세스에서도 이름으로 붙어 sequence 번호로 읽을 수 있음
+        sequence 번호는 센서가 수집을 시작한 이후 기록된 샘플의 누적 인덱스임
+    """
+    def __init__(self, name: str, capacity: int = 0, create: bool = False):
+        if create:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=HEADER_SIZE + capacity * 8)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+        self._is_owner = create
+
+        self._header = np.ndarray((2,), dtype=np.int64, buffer=self._shm.buf)
+        if create:
+            self._header[:] = (0, capacity)
+        self._capacity = int(self._header[1])
+        self._data = np.ndarray((self._capacity,), dtype=np.float64, buffer=self._shm.buf, offset=HEADER_SIZE)
+
+    @classmethod
+    def create(cls, name: str, capacity: int) -> 'SharedRingBuffer':
+        return cls(name=name, capacity=capacity, create=True)
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedRingBuffer':
+        return cls(name=name)
+
+    def name(self) -> str:
+        return self._shm.name
+
+    def capacity(self) -> int:
+        return self._capacity
+
+    def write_seq(self) -> int:
+        return int(self._header[0])
+
+    def oldest_seq(self) -> int:
+        return max(self.write_seq() - self._capacity, 0)
+
+    def write(self, data: np.ndarray) -> int:
+        # 데이터를 먼저 기록한 뒤 누적 샘플 수를 갱신하므로 소비자는 write_seq 이전 구간만 읽음
+        seq = self.write_seq()
+        count = len(data)
+        if count > self._capacity:
+            data = data[-self._capacity:]
+        pos = (seq + count - len(data)) % self._capacity
+        first = min(len(data), self._capacity - pos)
+        self._data[pos:pos + first] = data[:first]
+        self._data[:len(data) - first] = data[first:]
+        self._header[0] = seq + count
+        return seq
+
+    def read(self, seq: int, count: int) -> np.ndarray:
+        # 링의 끝을 넘지 않으면 공유 메모리의 view 를 그대로 반환하고, 넘으면 두 구간을 이어붙인 복사본을 반환함
+        # view 는 기록자가 한 바퀴 돌아 덮어쓰기 전까지만 유효하므로 is_valid 로 확인해야 함
+        pos = seq % self._capacity
+        if pos + count <= self._capacity:
+            return self._data[pos:pos + count]
+        return np.concatenate((self._data[pos:], self._data[:pos + count - self._capacity]))
+
+    def is_valid(self, seq: int) -> bool:
+        return seq >= self.oldest_seq()
+
+    def close(self) -> None:
+        del self._header, self._data
+        self._shm.close()
+        if self._is_owner:
+            self._shm.unlink()
+
+
+class RingReader:
+    """
+        SharedRingBuffer 의 소비자 커서
+        밀려서 덮어쓰인 구간은 건너뛰고 lost 로 집계하므로 재전송 없이 최신 데이터로 따라잡음
+    """
+    def __init__(self, ring: SharedRingBuffer, seq: int = None):
+        self._ring = ring
+        self._seq = ring.write_seq() if seq is None else seq
+        self.lost = 0
+
+    def seq(self) -> int:
+        return self._seq
+
+    def read_new(self) -> Tuple[int, np.ndarray]:
+        write_seq = self._ring.write_seq()
+        oldest = self._ring.oldest_seq()
+        if self._seq < oldest:
+            self.lost += oldest - self._seq
+            self._seq = oldest
+
+        seq = self._seq
+        data = self._ring.read(seq, write_seq - seq)
+        self._seq = write_seq
+        return seq, data
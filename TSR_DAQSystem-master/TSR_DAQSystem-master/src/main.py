@@ -1,5 +1,6 @@
 import os
 import sys
+from multiprocessing import freeze_support
 
 from app import App
 
@@ -9,5 +10,6 @@ if sys.stdout is None:
     sys.stdout = open(os.devnull, 'w')
 
 if __name__ == '__main__':
+    freeze_support()
     app = App()
     app.run()
@@ -1,10 +1,25 @@
+import numpy as np
 from time import time, localtime, strftime
 
+TIME_OFFSET: int = 11       # 'YYYY-MM-DDT' 이후
+TIME_LENGTH: int = 12       # 'HH:MM:SS.mmm'
+
 
 def get_time() -> str:
     return strftime('%H:%M:%S', localtime(time()))
 
 
+def get_times(start: float, rate: float, count: int) -> np.ndarray:
+    # 블록의 시작 시각(epoch sec)과 rate 로 샘플별 'HH:MM:SS.mmm' 문자열 배열을 한 번에 만듦
+    # 블록 하나는 짧으므로 시작 시각의 UTC offset 을 블록 전체에 사용함
+    offset = localtime(start).tm_gmtoff
+    millis = np.round((start + offset + np.arange(count) / rate) * 1000).astype('datetime64[ms]')
+    stamps = np.datetime_as_string(millis, unit='ms')          # 'YYYY-MM-DDTHH:MM:SS.mmm'
+    width = stamps.dtype.itemsize // 4
+    chars = stamps.view('U1').reshape(count, width)[:, TIME_OFFSET:TIME_OFFSET + TIME_LENGTH]
+    return np.ascontiguousarray(chars).view(f'U{TIME_LENGTH}').ravel()
+
+
 def get_hour() -> str:
     return strftime('%H', localtime(time()))
 
@@ -0,0 +1,90 @@
+"""
+    SimDevice 로 DAQSystem 전체 처리량을 측정하는 벤치마크
+    프로젝트 루트에서 실행 : python test/daq_benchmark.py --devices 4 --channels 16 --rate 25600 --seconds 30
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+from typing import Dict
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from background import DAQSystem
+from background.machine import EventHandler, MachineEvent
+from lib.metrics import get_registry
+from config import DAQSystemConfig, NIDeviceConfig, NIDeviceType, DeviceBackend, SensorConfig, MachineConfig, \
+    DataSendModeConfig, DataSaveModeConfig
+
+
+class SampleCounter(EventHandler):
+    def __init__(self):
+        self.samples = 0
+        self.updates = 0
+
+    async def event_handle(self, event: MachineEvent, data: Dict) -> None:
+        if event is MachineEvent.DataUpdate:
+            self.updates += 1
+            self.samples += sum(len(datas) for datas in data.values())
+
+
+def build_conf(devices: int, channels: int, rate: int, machines_per_device: int) -> DAQSystemConfig:
+    ni_devices = []
+    machines = []
+    for d_idx in range(devices):
+        sensors = [SensorConfig(NAME=f'dev{d_idx}_ch{c_idx}',
+                                CHANNEL=f'ai{c_idx}',
+                                OPTIONS={'frequency': 10 + c_idx, 'impulse_interval': 0.5})
+                   for c_idx in range(channels)]
+        ni_devices.append(NIDeviceConfig(NAME=f'sim_device{d_idx}',
+                                         TYPE=NIDeviceType.VIB,
+                                         RATE=rate,
+                                         SENSORS=sensors,
+                                         BACKEND=DeviceBackend.SIM))
+
+        per_machine = max(channels // machines_per_device, 1)
+        for m_idx in range(machines_per_device):
+            machines.append(MachineConfig(NAME=f'machine{d_idx}_{m_idx}',
+                                          SENSORS=[s.NAME for s in sensors[m_idx * per_machine:(m_idx + 1) * per_machine]],
+                                          FAULT_DETECTABLE=False,
+                                          FAULT_THRESHOLD=0,
+                                          DATA_SEND_MODE=DataSendModeConfig(ACTIVATION=False),
+                                          DATA_SAVE_MODE=DataSaveModeConfig(ACTIVATION=False)))
+    return DAQSystemConfig(NI_DEVICES=ni_devices, MACHINES=machines)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--devices', type=int, default=4)
+    parser.add_argument('--channels', type=int, default=16)
+    parser.add_argument('--rate', type=int, default=3000)
+    parser.add_argument('--machines-per-device', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=30)
+    args = parser.parse_args()
+
+    conf = build_conf(args.devices, args.channels, args.rate, args.machines_per_device)
+    system = DAQSystem(conf)
+    counter = SampleCounter()
+    for machine in system.get_machines():
+        machine.register_handler(counter)
+
+    loop = asyncio.get_event_loop()
+    loop.call_later(args.seconds, system.stop)
+
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    system.run()
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+
+    print(f'channels        : {args.devices * args.channels}')
+    print(f'elapsed         : {elapsed:.2f} sec (cpu {cpu:.2f} sec, {cpu / elapsed * 100:.1f} %)')
+    print(f'data updates    : {counter.updates} ({counter.updates / elapsed:.1f} /sec)')
+    print(f'samples         : {counter.samples} ({counter.samples / elapsed:.0f} /sec)')
+    print()
+    print(get_registry().format())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+    keras LstmAE 와 NumpyLstmAE 의 출력 / 감지 결과 / 속도 비교 (TensorFlow 와 h5py 필요)
+    프로젝트 루트에서 실행 : python test/lstm_ae_parity.py --seq-len 30 --latent-dim 16 --batch-size 3000
+    학습된 모델 비교 : python test/lstm_ae_parity.py --model-dir resources/model/<machine>
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from lib.lstm_ae import NumpyLstmAE, ModelConfig, InferenceEngine, load_model, load_model_configs
+from lib.lstm_ae.lstm_ae import LstmAE
+
+
+def random_model(seq_len: int, latent_dim: int, batch_size: int, threshold: float, path: str) -> ModelConfig:
+    # 임의 가중치의 keras 모델을 저장해 비교 대상으로 사용함
+    conf = ModelConfig(NAME='parity', BATCH_SIZE=batch_size, LATENT_DIM=latent_dim, SEQ_LEN=seq_len, THRESHOLD=threshold)
+    model = LstmAE(seq_len=seq_len, input_dim=1, latent_dim=latent_dim, batch_size=batch_size, threshold=threshold)
+    model.build((None, seq_len, 1))
+    model.save_weights(os.path.join(path, f'{conf.NAME}.h5'))
+    return conf
+
+
+def measure(func, repeat: int):
+    func()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        out = func()
+    return (time.perf_counter() - start) / repeat, out
+
+
+def compare(model_dir: str, conf: ModelConfig, repeat: int) -> None:
+    keras_model = load_model(model_dir, conf, InferenceEngine.KERAS)
+    numpy_model = load_model(model_dir, conf, InferenceEngine.NUMPY)
+    numpy_model64 = NumpyLstmAE(seq_len=conf.SEQ_LEN, input_dim=1, latent_dim=conf.LATENT_DIM,
+                                batch_size=conf.BATCH_SIZE, threshold=conf.THRESHOLD, dtype=np.float64)
+    numpy_model64.load(os.path.join(model_dir, f'{conf.NAME}.h5'))
+
+    t = np.arange(conf.BATCH_SIZE)
+    batch = np.sin(2 * np.pi * t / 50) + 0.3 * np.random.default_rng(0).standard_normal(conf.BATCH_SIZE)
+    inputs = keras_model._data_to_input(batch)
+
+    keras_time, keras_out = measure(lambda: keras_model._forward(inputs), repeat)
+    numpy_time, numpy_out = measure(lambda: numpy_model._forward(inputs), repeat)
+    numpy64_time, numpy64_out = measure(lambda: numpy_model64._forward(inputs), repeat)
+
+    print(f'{conf.NAME} : {len(inputs)} windows x {conf.SEQ_LEN} steps, latent {conf.LATENT_DIM}')
+    print(f'  keras         : {keras_time * 1000:8.2f} ms')
+    print(f'  numpy float32 : {numpy_time * 1000:8.2f} ms, max abs diff {np.abs(numpy_out - keras_out).max():.2e}')
+    print(f'  numpy float64 : {numpy64_time * 1000:8.2f} ms, max abs diff {np.abs(numpy64_out - keras_out).max():.2e}')
+    print(f'  anomalies     : keras {keras_model.detect_batches([batch])[0]}, '
+          f'numpy {numpy_model.detect_batches([batch])[0]}')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--model-dir', default=None)
+    parser.add_argument('--seq-len', type=int, default=30)
+    parser.add_argument('--latent-dim', type=int, default=16)
+    parser.add_argument('--batch-size', type=int, default=3000)
+    parser.add_argument('--threshold', type=float, default=0.5)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    if args.model_dir is not None:
+        for conf in load_model_configs(args.model_dir):
+            compare(args.model_dir, conf, args.repeat)
+        return
+
+    with tempfile.TemporaryDirectory() as path:
+        conf = random_model(args.seq_len, args.latent_dim, args.batch_size, args.threshold, path)
+        compare(path, conf, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+    블록 단위 FFT 리샘플링(signal.resample) 과 StreamResampler 비교
+    프로젝트 루트에서 실행 : python test/resample_benchmark.py --rate 1000 --channels 16
+"""
+import os
+import sys
+import time
+import argparse
+import numpy as np
+from scipy import signal
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from lib.daq.resampler import StreamResampler
+from lib.daq.ni_device.ni_device import MIN_RATE
+
+
+def fft_blocks(data: np.ndarray, real_rate: int, rate: int) -> np.ndarray:
+    blocks = [signal.resample(data[:, idx:idx + real_rate], rate, axis=1)
+              for idx in range(0, data.shape[1], real_rate)]
+    return np.concatenate(blocks, axis=1)
+
+
+def stream_blocks(data: np.ndarray, real_rate: int, rate: int) -> np.ndarray:
+    resampler = StreamResampler(real_rate, rate, data.shape[0])
+    blocks = [resampler.process(data[:, idx:idx + real_rate])
+              for idx in range(0, data.shape[1], real_rate)]
+    return np.concatenate(blocks, axis=1)
+
+
+def measure(func, data: np.ndarray, real_rate: int, rate: int, repeat: int):
+    func(data, real_rate, rate)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        out = func(data, real_rate, rate)
+    return (time.perf_counter() - start) / repeat, out
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rate', type=int, default=1000)
+    parser.add_argument('--channels', type=int, default=16)
+    parser.add_argument('--seconds', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    real_rate = MIN_RATE
+    t = np.arange(real_rate * args.seconds) / real_rate
+    freqs = np.linspace(5, args.rate / 4, args.channels)[:, None]
+    data = np.sin(2 * np.pi * freqs * t)
+
+    # 블록 경계 왜곡 비교용 기준 신호 (전체 구간을 한 번에 변환)
+    # StreamResampler 는 causal 필터이므로 자신을 전체 구간에 한 번에 적용한 결과와 비교함
+    reference = signal.resample_poly(data, args.rate, real_rate, axis=1)
+    stream_reference = StreamResampler(real_rate, args.rate, data.shape[0]).process(data)
+
+    fft_time, fft_out = measure(fft_blocks, data, real_rate, args.rate, args.repeat)
+    stream_time, stream_out = measure(stream_blocks, data, real_rate, args.rate, args.repeat)
+    first_block = StreamResampler(real_rate, args.rate, data.shape[0]).process(data[:, :real_rate]).shape[1]
+
+    margin = args.rate
+    fft_err = np.abs(fft_out - reference)[:, margin:-margin].max()
+    stream_err = np.abs(stream_out - stream_reference).max()
+
+    per_block = args.seconds * args.channels
+    print(f'{real_rate} -> {args.rate} Hz, {args.channels} channels, {args.seconds} blocks')
+    print(f'signal.resample  : {fft_time * 1000:8.2f} ms ({fft_time / per_block * 1e6:7.1f} us/channel-block), '
+          f'block edge error {fft_err:.2e}')
+    print(f'StreamResampler  : {stream_time * 1000:8.2f} ms ({stream_time / per_block * 1e6:7.1f} us/channel-block), '
+          f'block edge error {stream_err:.2e}, first block {first_block} samples')
+
+
+if __name__ == '__main__':
+    main()
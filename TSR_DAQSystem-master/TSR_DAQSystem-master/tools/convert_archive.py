@@ -0,0 +1,73 @@
+"""
+    DataSaver 저장 파일을 CSV 와 BINARY (float32 chunk) 형식 사이에서 변환하는 도구
+    CSV 를 사용하는 기존 도구 (score_archive, train_models 등) 에 BINARY 로 저장한 데이터를 사용할 때 CSV 로 변환함
+    프로젝트 루트에서 실행 : python tools/convert_archive.py --machine machine1 --start 20240101 --end 20240131 --to BINARY
+"""
+import os
+import sys
+import time
+import argparse
+from datetime import datetime, timedelta
+from typing import List
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from lib.archive import csv_to_archive, archive_to_csv, list_sensors
+from lib.archive.converter import GAP_TOLERANCE
+from config import SaveFormat
+from config.paths import DATA_DIR
+
+
+def _dates(start: str, end: str) -> List[str]:
+    begin = datetime.strptime(start, '%Y%m%d')
+    days = (datetime.strptime(end, '%Y%m%d') - begin).days
+    return [(begin + timedelta(days=day)).strftime('%Y%m%d') for day in range(days + 1)]
+
+
+def _csv_sensors(directory: str, date: str) -> List[str]:
+    prefix = f'{date}_'
+    return sorted(file_name[len(prefix):-len('.csv')] for file_name in os.listdir(directory)
+                  if file_name.startswith(prefix) and file_name.endswith('.csv'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert DataSaver files between CSV and BINARY formats')
+    parser.add_argument('--machine', required=True)
+    parser.add_argument('--start', required=True, help='YYYYMMDD')
+    parser.add_argument('--end', help='YYYYMMDD, 기본값은 start')
+    parser.add_argument('--to', required=True, choices=[save_format.name for save_format in SaveFormat])
+    parser.add_argument('--data-dir', default=DATA_DIR, help='원본 파일 경로, 기본값은 DATA_DIR')
+    parser.add_argument('--output-dir', help='변환 파일 경로, 기본값은 data-dir')
+    parser.add_argument('--rate', type=float, help='CSV -> BINARY 변환 시 rate, 없으면 시각으로 추정함')
+    parser.add_argument('--tolerance', type=float, default=GAP_TOLERANCE,
+                        help='CSV -> BINARY 변환 시 끊긴 구간으로 볼 샘플 간격 오차 (sec)')
+    args = parser.parse_args()
+
+    src_dir = os.path.join(args.data_dir, args.machine)
+    dst_dir = os.path.join(args.output_dir or args.data_dir, args.machine)
+    os.makedirs(dst_dir, exist_ok=True)
+    to_binary = SaveFormat[args.to] is SaveFormat.BINARY
+
+    begin = time.perf_counter()
+    total = 0
+    for date in _dates(args.start, args.end or args.start):
+        sensors = _csv_sensors(src_dir, date) if to_binary else list_sensors(src_dir, date)
+        for sensor in sensors:
+            try:
+                if to_binary:
+                    count = csv_to_archive(os.path.join(src_dir, f'{date}_{sensor}.csv'), dst_dir, date, sensor,
+                                           rate=args.rate, tolerance=args.tolerance)
+                else:
+                    count = archive_to_csv(src_dir, date, sensor, os.path.join(dst_dir, f'{date}_{sensor}.csv'))
+            except Exception as err:
+                print(f'Convert Error ({date}_{sensor}) : \n{str(err)}')
+                continue
+            total += count
+            print(f'{date}_{sensor} : {count} samples')
+
+    elapsed = time.perf_counter() - begin
+    print(f'Converted : {total} samples, {elapsed:.2f} sec')
+
+
+if __name__ == '__main__':
+    main()
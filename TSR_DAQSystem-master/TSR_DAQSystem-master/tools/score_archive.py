@@ -0,0 +1,146 @@
+"""
+    DataSaver 가 저장한 일별 CSV 를 Machine 과 같은 모델로 다시 채점하는 오프라인 도구
+    THRESHOLD 를 바꾸거나 새 모델을 배포하기 전에 지난 데이터에서의 결과를 확인할 때 사용함
+    프로젝트 루트에서 실행 : python tools/score_archive.py --machine machine1 --start 20240101 --end 20240131
+"""
+import os
+import csv
+import sys
+import time
+import argparse
+from datetime import datetime, timedelta
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from lib.lstm_ae import ModelRegistry, InferenceEngine, load_model_configs
+from config.paths import DATA_DIR, MODEL_DIR
+
+CHUNK_BATCHES: int = 32     # 한 번에 읽어서 한 번의 forward pass 로 채점할 배치 수
+OUTPUT_HEADER = ['date', 'sensor', 'batch', 'time', 'windows', 'anomalies', 'mean_mae', 'max_mae']
+
+_registry: ModelRegistry = None
+
+
+def _init_worker(engine: InferenceEngine) -> None:
+    global _registry
+    _registry = ModelRegistry(engine)
+
+
+def _score_file(model_dir: str, model_name: str, path: str, chunk_batches: int) -> List[Tuple]:
+    # 파일을 chunk_batches 배치씩 읽으며 Machine 과 같은 크기의 배치로 나눠 채점함
+    # 파일 끝의 채워지지 않은 배치는 Machine 에서도 채점되지 않으므로 버림
+    conf = next(conf for conf in load_model_configs(model_dir) if conf.NAME == model_name)
+    model = _registry.get(model_dir, conf)
+    batch_size = conf.BATCH_SIZE
+
+    rows = []
+    batch_index = 0
+    with open(path, 'r', newline='') as file:
+        next(file, None)    # header
+        while True:
+            lines = list(islice(file, batch_size * chunk_batches))
+            n_batches = len(lines) // batch_size
+            if not n_batches:
+                break
+
+            lines = lines[:n_batches * batch_size]
+            data = np.loadtxt(lines, delimiter=',', usecols=1, dtype=np.float32, ndmin=1)
+            batches = np.split(data, n_batches)
+            for idx, mae in enumerate(model.score_batches(batches)):
+                start_time = lines[idx * batch_size].split(',', 1)[0]
+                rows.append((batch_index, start_time, len(mae), int(np.count_nonzero(mae > model.threshold)),
+                             float(mae.mean()) if len(mae) else 0.0, float(mae.max()) if len(mae) else 0.0))
+                batch_index += 1
+    return rows
+
+
+def _dates(start: str, end: str) -> List[str]:
+    begin = datetime.strptime(start, '%Y%m%d')
+    days = (datetime.strptime(end, '%Y%m%d') - begin).days
+    return [(begin + timedelta(days=day)).strftime('%Y%m%d') for day in range(days + 1)]
+
+
+def _find_file(data_dirs: List[str], machine: str, date: str, sensor: str) -> str:
+    for data_dir in data_dirs:
+        path = os.path.join(data_dir, machine, f'{date}_{sensor}.csv')
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Score archived DataSaver CSV files offline')
+    parser.add_argument('--machine', required=True)
+    parser.add_argument('--start', required=True, help='YYYYMMDD')
+    parser.add_argument('--end', help='YYYYMMDD, 기본값은 start')
+    parser.add_argument('--data-dir', action='append', dest='data_dirs',
+                        help='CSV 를 찾을 경로 (여러 번 지정 가능), 기본값은 DATA_DIR')
+    parser.add_argument('--model-dir', help=f'기본값은 {MODEL_DIR}/<machine>')
+    parser.add_argument('--output', help='기본값은 score_<machine>_<start>_<end>.csv')
+    parser.add_argument('--engine', default='NUMPY', choices=[engine.name for engine in InferenceEngine])
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--chunk-batches', type=int, default=CHUNK_BATCHES)
+    parser.add_argument('--fault-threshold', type=int,
+                        help='지정하면 센서 점수 합이 이 값을 넘는 배치 수를 함께 출력함 (Machine FAULT_THRESHOLD)')
+    args = parser.parse_args()
+
+    end = args.end or args.start
+    data_dirs = args.data_dirs or [DATA_DIR]
+    model_dir = args.model_dir or os.path.join(MODEL_DIR, args.machine)
+    output = args.output or f'score_{args.machine}_{args.start}_{end}.csv'
+    model_names = [conf.NAME for conf in load_model_configs(model_dir)]
+
+    jobs: Dict[Tuple[str, str], str] = {}
+    for date in _dates(args.start, end):
+        for sensor in model_names:
+            path = _find_file(data_dirs, args.machine, date, sensor)
+            if path is None:
+                print(f'Not Found : {date}_{sensor}.csv')
+                continue
+            jobs[(date, sensor)] = path
+    if not jobs:
+        print('No files to score')
+        return
+
+    begin = time.perf_counter()
+    results: Dict[Tuple[str, str], List[Tuple]] = {}
+    # 파일 (날짜, 센서) 단위로 작업 프로세스에 나눠 각 프로세스가 직접 파일을 읽고 채점함
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker, initargs=(InferenceEngine[args.engine],)) as pool:
+        futures = {key: pool.submit(_score_file, model_dir, key[1], path, args.chunk_batches)
+                   for key, path in jobs.items()}
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except Exception as err:
+                print(f'Scoring Error ({jobs[key]}) : \n{str(err)}')
+    elapsed = time.perf_counter() - begin
+
+    windows = 0
+    batch_scores: Dict[Tuple[str, int], int] = {}
+    with open(output, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(OUTPUT_HEADER)
+        for (date, sensor), rows in sorted(results.items()):
+            for batch_index, start_time, n_windows, anomalies, mean_mae, max_mae in rows:
+                writer.writerow([date, sensor, batch_index, start_time, n_windows, anomalies,
+                                 f'{mean_mae:.6g}', f'{max_mae:.6g}'])
+                windows += n_windows
+                batch_scores[(date, batch_index)] = batch_scores.get((date, batch_index), 0) + anomalies
+
+    print(f'Files : {len(results)}/{len(jobs)}, Batches : {sum(len(rows) for rows in results.values())}, '
+          f'Windows : {windows}')
+    print(f'Elapsed : {elapsed:.2f} sec, {windows / elapsed:.1f} windows/sec')
+    if args.fault_threshold is not None:
+        # Machine 과 같이 같은 순번의 센서 배치 점수를 합쳐 FAULT_THRESHOLD 와 비교함
+        faults = sum(score > args.fault_threshold for score in batch_scores.values())
+        print(f'Fault Batches : {faults}/{len(batch_scores)} (threshold {args.fault_threshold})')
+    print(f'Output : {output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+    DataSaver 가 저장한 일별 CSV 로 Machine 의 센서별 LstmAE 모델을 학습하는 도구
+    센서마다 {name}.h5 를 저장하고 Machine 이 읽는 METADATA.yml 과 사전 필터용 PREFILTER.yml 을 작성함
+    학습 데이터는 정상 상태에서 수집된 날짜만 지정해야 함
+    프로젝트 루트에서 실행 : python tools/train_models.py --machine machine1 --start 20240101 --end 20240107
+"""
+import os
+import sys
+import argparse
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from lib.lstm_ae import (ModelConfig, TrainConfig, train_model, load_model_configs, save_model_configs,
+                         load_prefilter, save_prefilter)
+from lib.lstm_ae.model_loader import METADATA_FILE
+from lib.lstm_ae.prefilter import AUDIT_INTERVAL
+from config.paths import DATA_DIR, MODEL_DIR
+
+
+def _dates(start: str, end: str) -> List[str]:
+    begin = datetime.strptime(start, '%Y%m%d')
+    days = (datetime.strptime(end, '%Y%m%d') - begin).days
+    return [(begin + timedelta(days=day)).strftime('%Y%m%d') for day in range(days + 1)]
+
+
+def _find_files(data_dirs: List[str], machine: str, dates: List[str], sensors: List[str]) -> Dict[str, List[str]]:
+    # {센서 -> 날짜순 CSV 경로 목록}, sensors 가 없으면 파일 이름에서 센서를 찾음
+    files: Dict[str, List[str]] = {}
+    for data_dir in data_dirs:
+        machine_dir = os.path.join(data_dir, machine)
+        if not os.path.isdir(machine_dir):
+            continue
+        for file_name in sorted(os.listdir(machine_dir)):
+            stem, ext = os.path.splitext(file_name)
+            date, _, sensor = stem.partition('_')
+            if ext != '.csv' or date not in dates or (sensors and sensor not in sensors):
+                continue
+            files.setdefault(sensor, []).append(os.path.join(machine_dir, file_name))
+    return files
+
+
+def _load_existing(model_dir: str) -> Tuple[Dict[str, ModelConfig], Dict[str, np.ndarray], int]:
+    # 이번에 학습하지 않는 센서의 기존 모델 설정과 사전 필터 범위를 유지하기 위해 미리 읽어둠
+    confs = {}
+    if os.path.isfile(os.path.join(model_dir, METADATA_FILE)):
+        confs = {conf.NAME: conf for conf in load_model_configs(model_dir)}
+    prefilter = load_prefilter(model_dir)
+    if prefilter is None:
+        return confs, {}, AUDIT_INTERVAL
+    return confs, prefilter.bands(), prefilter.audit_interval()
+
+
+def main():
+    defaults = TrainConfig()
+    parser = argparse.ArgumentParser(description='Train LstmAE models from archived DataSaver CSV files')
+    parser.add_argument('--machine', required=True)
+    parser.add_argument('--start', required=True, help='YYYYMMDD')
+    parser.add_argument('--end', help='YYYYMMDD, 기본값은 start')
+    parser.add_argument('--sensors', nargs='*', help='학습할 센서, 기본값은 찾은 모든 센서')
+    parser.add_argument('--data-dir', action='append', dest='data_dirs',
+                        help='CSV 를 찾을 경로 (여러 번 지정 가능), 기본값은 DATA_DIR')
+    parser.add_argument('--model-dir', help=f'기본값은 {MODEL_DIR}/<machine>')
+    parser.add_argument('--seq-len', type=int, default=defaults.SEQ_LEN)
+    parser.add_argument('--latent-dim', type=int, default=defaults.LATENT_DIM)
+    parser.add_argument('--batch-size', type=int, default=defaults.BATCH_SIZE)
+    parser.add_argument('--window-stride', type=int, default=defaults.WINDOW_STRIDE)
+    parser.add_argument('--epochs', type=int, default=defaults.EPOCHS)
+    parser.add_argument('--percentile', type=float, default=defaults.PERCENTILE)
+    parser.add_argument('--holdout-every', type=int, default=defaults.HOLDOUT_EVERY)
+    args = parser.parse_args()
+
+    t_conf = TrainConfig(SEQ_LEN=args.seq_len,
+                         LATENT_DIM=args.latent_dim,
+                         BATCH_SIZE=args.batch_size,
+                         WINDOW_STRIDE=args.window_stride,
+                         EPOCHS=args.epochs,
+                         PERCENTILE=args.percentile,
+                         HOLDOUT_EVERY=args.holdout_every)
+    model_dir = args.model_dir or os.path.join(MODEL_DIR, args.machine)
+    files = _find_files(args.data_dirs or [DATA_DIR], args.machine, _dates(args.start, args.end or args.start),
+                        args.sensors)
+    if not files:
+        print('No files to train')
+        return
+
+    os.makedirs(model_dir, exist_ok=True)
+    # 학습에 실패하기 전에 기존 파일을 읽을 수 없는 경우를 먼저 확인함
+    confs, bands, audit_interval = _load_existing(model_dir)
+    trained = []
+    for sensor, paths in files.items():
+        print(f'Training : {sensor} ({len(paths)} files)')
+        try:
+            conf, sensor_bands, report = train_model(model_dir, sensor, paths, t_conf)
+        except Exception as err:
+            print(f'Training Error ({sensor}) : \n{str(err)}')
+            continue
+        confs[sensor] = conf
+        bands[sensor] = sensor_bands
+        trained.append(sensor)
+        print(f'{sensor} : train windows {report.TRAIN_WINDOWS}, holdout windows {report.HOLDOUT_WINDOWS}, '
+              f'threshold {report.THRESHOLD:.6g}, train {report.TRAIN_TIME:.1f} sec, '
+              f'total {report.TOTAL_TIME:.1f} sec, peak RSS {report.PEAK_MEMORY / 2 ** 20:.1f} MiB')
+
+    if trained:
+        # 같은 이름의 기존 항목은 새 결과로 교체하고 나머지 센서의 항목은 그대로 저장함
+        save_model_configs(model_dir, list(confs.values()))
+        save_prefilter(model_dir, bands, audit_interval)
+        print(f'Saved : {model_dir} ({", ".join(trained)})')
+
+
+if __name__ == '__main__':
+    main()
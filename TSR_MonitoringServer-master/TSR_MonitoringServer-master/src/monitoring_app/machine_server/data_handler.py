@@ -1,10 +1,11 @@
 import os
+import threading
 from typing import Dict, List
 from datetime import date, time, datetime, timedelta
 from multiprocessing import connection
 
 from config import StatConfig, DBConfig, DataConfig
-from util.clock import TimeEvent, get_date, get_time
+from util.clock import TimeEvent, get_date, get_time, get_times
 from database import MachineDatabase
 from util.csv_writer import CsvWriter
 from util.fcm_sender import FCMSender
@@ -31,6 +32,17 @@ class Stat:
         return average
 
 
+def _close_writers(writers: Dict[str, CsvWriter]):
+    for writer in writers.values():
+        writer.close()
+
+
+def _close_writers_background(writers: Dict[str, CsvWriter]):
+    # daemon 이 아닌 스레드이므로 프로세스가 종료되기 전에 남은 행을 모두 씀
+    if writers:
+        threading.Thread(target=_close_writers, args=(writers,), name='DataHandler.close_writers').start()
+
+
 class DataHandler:
     def __init__(self, machine_name: str, w_conn: connection.Connection):
         self.machine_name = machine_name
@@ -47,12 +59,26 @@ class DataHandler:
         self.fcm_sender = FCMSender()
 
     def _init_writers(self):
+        # 아직 파일이 없는 센서만 새로 열어 이미 쓰고 있는 파일은 그대로 유지함
         os.makedirs(self.save_path, exist_ok=True)
         for sensor in self.stats.keys():
+            if sensor in self.writers:
+                continue
             header: List[str] = ['time', 'data']
             path = os.path.join(self.save_path, f'{get_date()}_{sensor}.csv')
             self.writers[sensor] = CsvWriter(path, header)
 
+    def _rotate_writers(self):
+        # 날짜가 바뀐 경우 새 날짜의 파일로 먼저 바꾸고 이전 파일은 별도 스레드에서 닫음
+        writers, self.writers = self.writers, {}
+        self._init_writers()
+        _close_writers_background(writers)
+
+    def close(self):
+        # 남은 행 쓰기가 끝날 때까지 기다리면 이벤트 루프가 멈추므로 별도 스레드에서 닫음
+        writers, self.writers = self.writers, {}
+        _close_writers_background(writers)
+
     async def data_processing(self, machine_event, data: Dict):
         if machine_event == MachineEvent.DataUpdate.name:
             await self._data_update_handle(data)
@@ -68,7 +94,7 @@ class DataHandler:
 
                 if self.time.is_day_change():
                     await self._save_day_avg()
-                    self._init_writers()
+                    self._rotate_writers()
 
                     if self.time.is_month_change():
                         await self._save_month_avg()
@@ -89,8 +115,13 @@ class DataHandler:
             self.stats[s_name].add(s_data['data'])
             self.min_stats[s_name].add(s_data['data'])
 
-            datas = [[cur_time, data] for data in s_data['data']]
-            self.writers[s_name].add_datas(datas)
+            # 수집 측에서 보낸 블록 시작 시각과 rate 가 있으면 샘플별 시각을 사용하고, 없으면 수신 시각을 사용함
+            if 'start' in s_data and 'rate' in s_data:
+                times = get_times(s_data['start'], s_data['rate'], len(s_data['data'])).tolist()
+            else:
+                times = [cur_time] * len(s_data['data'])
+            self.writers[s_name].add_datas(list(zip(times, s_data['data'])))
+            await self.writers[s_name].drain()
 
     async def _anomaly_handle(self, data: Dict):
         self.w_conn.send(
@@ -64,6 +64,8 @@ class MachineThread(Protocol):
 
     def connection_lost(self, exc) -> None:
         self.w_conn.send(pipe_serialize(event=MachineThreadEvent.DISCONNECT, machine_name=self.machine_name))
+        if self.data_handler is not None:
+            self.data_handler.close()
         self.writer.close()
 
     def deserialize(self, serialized: bytes):
@@ -1,27 +1,107 @@
 import os
 import csv
-from typing import List
+import asyncio
+import threading
+from typing import List, Iterable
+
+FLUSH_ROWS: int = 100_000           # 대기 행이 이만큼 쌓이면 주기를 기다리지 않고 바로 씀
+FLUSH_INTERVAL: float = 1.0         # sec, 대기 행을 최소 이 주기마다 씀
+MAX_ROWS: int = 2_000_000           # 대기 행 상한, 넘으면 drain / wait_writable 이 쓰기가 따라잡을 때까지 대기함
+FILE_BUFFER_SIZE: int = 1 << 20     # bytes
 
 
 class CsvWriter:
-    def __init__(self, path: str, header: List[str]):
+    """
+        파일을 열어둔 채로 행을 메모리에 모았다가 백그라운드 스레드에서 한 번에 쓰는 CSV 저장기
+        add_datas 는 행을 대기열에 넣기만 하므로 호출한 이벤트 루프에서는 파일 I/O 가 일어나지 않음
+        add_datas 는 대기하지 않으므로, 대기 행이 max_rows 를 넘지 않게 하려면
+        이벤트 루프에서는 await drain(), 일반 스레드에서는 wait_writable() 을 이어서 호출함
+        날짜가 바뀌면 close 로 남은 행을 모두 쓰고 파일을 닫은 뒤 새 CsvWriter 를 만들어 사용함
+    """
+    def __init__(self,
+                 path: str,
+                 header: List[str],
+                 flush_rows: int = FLUSH_ROWS,
+                 flush_interval: float = FLUSH_INTERVAL,
+                 max_rows: int = MAX_ROWS):
         self._path = path
         self._header = header
-        self._file_init()
+        self._flush_rows = flush_rows
+        self._flush_interval = flush_interval
+        self._max_rows = max_rows
+
+        self._cond = threading.Condition()
+        self._pending: List[List] = []
+        self._pending_rows: int = 0
+        self._closed: bool = False
+
+        self._file = self._file_init()
+        self._thread = threading.Thread(target=self._run, name=f'CsvWriter({os.path.basename(path)})', daemon=True)
+        self._thread.start()
 
     def _file_init(self):
-        if not os.path.isfile(self._path):
-            with open(self._path, "w", newline='\n') as file:
-                writer = csv.writer(file)
-                writer.writerow(self._header)
+        file = open(self._path, "a", newline='\n', buffering=FILE_BUFFER_SIZE)
+        if file.tell() == 0:
+            csv.writer(file).writerow(self._header)
+        return file
+
+    def get_path(self) -> str:
+        return self._path
+
+    def add_datas(self, datas: Iterable):
+        rows = datas if isinstance(datas, list) else list(datas)
+        if not rows:
+            return
+        with self._cond:
+            if self._closed:
+                print(f'CSV Write Error : \n{self._path} is closed')
+                return
+            # 저장 데이터는 버리지 않으며, 대기열이 가득 찼을 때의 대기는 drain / wait_writable 이 맡음
+            self._pending.append(rows)
+            self._pending_rows += len(rows)
+            if self._pending_rows >= self._flush_rows:
+                self._cond.notify_all()
+
+    def is_full(self) -> bool:
+        return self._pending_rows >= self._max_rows
+
+    def wait_writable(self) -> None:
+        # 대기 행이 max_rows 아래로 줄어들 때까지 호출한 스레드를 대기시킴
+        with self._cond:
+            self._cond.wait_for(lambda: self._pending_rows < self._max_rows or self._closed)
+
+    async def drain(self) -> None:
+        # 대기열이 가득 찼을 때만 executor 에서 기다리므로 이벤트 루프는 막히지 않고,
+        # 호출한 handler 가 기다리는 동안 그 압력은 handler 의 Dispatcher 로 전달됨
+        if self.is_full():
+            await asyncio.get_running_loop().run_in_executor(None, self.wait_writable)
+
+    def close(self) -> None:
+        # 남은 행을 모두 쓰고 파일을 닫음
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
 
-    def add_datas(self, datas: List[List]):
-        try:
-            self._file_init()
+    def _run(self) -> None:
+        writer = csv.writer(self._file)
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending_rows >= self._flush_rows or self._closed,
+                                    timeout=self._flush_interval)
+                pending, self._pending, self._pending_rows = self._pending, [], 0
+                closed = self._closed
+                self._cond.notify_all()
 
-            with open(self._path, "a", newline='\n') as file:
-                writer = csv.writer(file)
-                writer.writerows(datas)
+            try:
+                for rows in pending:
+                    writer.writerows(rows)
+                self._file.flush()
+            except Exception as err:
+                print(f'CSV Write Error : \n{str(err)}')
 
-        except Exception as err:
-            print('CSV Write Error : \n', err)
+            if closed:
+                break
+        self._file.close()